@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-import sys
 from collections.abc import Callable, Iterable, Iterator
 from glob import glob
 from os import sep
@@ -22,10 +21,7 @@ from os.path import dirname, isfile, join, normpath, relpath
 from re import Pattern, compile
 from typing import Any, Dict
 
-if sys.version_info >= (3, 11):
-    from tomllib import load
-else:
-    from tomli import load
+from .._toml import load
 
 path_stars = compile(r"[*](?:[*](?:[/\\][*]*)?)?")
 path_var = compile(r"{(\w+)}")
@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from re import fullmatch
+from re import compile
 from typing import Any, Iterator
 
 from fluent.syntax import FluentSerializer
@@ -24,6 +24,9 @@ from fluent.syntax import ast as ftl
 from ... import message as msg
 from .. import data as res
 
+re_identifier = compile(r"[a-zA-Z][\w-]*")
+re_message_ref = compile(r"(-?[a-zA-Z][\w-]*)(?:\.([a-zA-Z][\w-]*))?")
+
 
 def fluent_serialize(
     resource: (
@@ -265,7 +268,7 @@ def variant_key(
         float(kv)
         return ftl.NumberLiteral(kv)
     except Exception:
-        if fullmatch(r"[a-zA-Z][\w-]*", kv):
+        if re_identifier.fullmatch(kv):
             return ftl.Identifier(kv)
         raise ValueError(f"Unsupported variant key: {kv}")
 
@@ -321,7 +324,7 @@ def function_ref(
             raise ValueError(
                 "Message and term references must have a literal message identifier"
             )
-        match = fullmatch(r"(-?[a-zA-Z][\w-]*)(?:\.([a-zA-Z][\w-]*))?", arg.value)
+        match = re_message_ref.fullmatch(arg.value)
         if not match:
             raise ValueError(f"Invalid message or term identifier: {arg.value}")
         msg_id = match[1]
@@ -72,6 +72,19 @@ Extensions used by file formats (XLIFF & gettext) that contain
 both the reference and target languages in the same file.
 """
 
+ext_formats: dict[str, Format] = {
+    ".dtd": Format.dtd,
+    ".ftl": Format.fluent,
+    ".inc": Format.inc,
+    ".ini": Format.ini,
+    ".properties": Format.properties,
+    ".po": Format.po,
+    ".pot": Format.po,
+    ".xlf": Format.xliff,
+    ".xliff": Format.xliff,
+}
+"""Extensions that identify a format without inspecting the file contents."""
+
 
 def detect_format(name: str | None, source: bytes | str) -> Format | None:
     """
@@ -84,20 +97,8 @@ def detect_format(name: str | None, source: bytes | str) -> Format | None:
         ext = None
     else:
         _, ext = splitext(name)
-        if ext == ".dtd":
-            return Format.dtd
-        elif ext == ".ftl":
-            return Format.fluent
-        elif ext == ".inc":
-            return Format.inc
-        elif ext == ".ini":
-            return Format.ini
-        elif ext == ".properties":
-            return Format.properties
-        elif ext in {".po", ".pot"}:
-            return Format.po
-        elif ext in {".xlf", ".xliff"}:
-            return Format.xliff
+        if ext in ext_formats:
+            return ext_formats[ext]
 
     # Try parsing as JSON first, unless we're pretty sure it's XML
     if ext != ".xml":
@@ -36,11 +36,20 @@ def l10n_equal(a: Resource[Any, Any], b: Resource[Any, Any]) -> bool:
     return (
         a.format == b.format
         and a.comment.strip() == b.comment.strip()
+        and l10n_entry_count(a) == l10n_entry_count(b)
         and l10n_meta(a) == l10n_meta(b)
         and l10n_sections(a) == l10n_sections(b)
     )
 
 
+def l10n_entry_count(resource: Resource[Any, Any]) -> int:
+    return sum(
+        isinstance(entry, Entry)
+        for section in resource.sections
+        for entry in section.entries
+    )
+
+
 def l10n_sections(resource: Resource[Any, Any]) -> _L10nData[_L10nData[Any]]:
     ls = [
         (section.id, section.comment.strip(), l10n_meta(section), l10n_entries(section))
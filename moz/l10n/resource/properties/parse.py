@@ -15,7 +15,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from re import Match, compile
+from re import DOTALL, Match, compile
 from typing import Any, Callable
 
 from moz.l10n.message import Message, PatternMessage
@@ -32,6 +32,10 @@ class LineKind(Enum):
 
 
 esc_re = compile("\\\\(u[0-9A-Fa-f]{1,4}|.)")
+ws_re = compile(r"[ \t\f]*")
+eol_re = compile(r"[\n\r]")
+key_re = compile(r"(?:\\.|[^\\\n\r\t\f =:])*\\?", DOTALL)
+value_line_re = compile(r"(?:\\[^\n\r]|[^\\\n\r])*(?:\\\Z)?")
 
 
 def esc_parse(match: Match[str]) -> str:
@@ -147,35 +151,21 @@ class PropertiesParser:
         if self.at_value:
             # value
             self.at_value = False
-            line_start = start = self.pos
-            at_escape = False
-            at_cr = False
-            idx = -1
+            source = self.source
+            line_start = self.pos
             lines: list[str] = []
-            for idx, ch in enumerate(self.source[start:]):
-                if ch == "\n" or ch == "\r":
-                    if at_escape:
-                        at_escape = False
-                        self.line_pos += 1
-                        end = start + idx - 1
-                        lines.append(self.source[line_start:end])
-                        at_cr = ch == "\r"
-                        line_start = start + idx + 1
-                    elif ch == "\n" and at_cr:
-                        at_cr = False
-                        line_start = start + idx + 1
-                    else:
-                        idx -= 1
-                        break
-                else:
-                    if at_cr:
-                        at_cr = False
-                    if at_escape:
-                        at_escape = False
-                    elif ch == "\\":
-                        at_escape = True
-            self.pos = end = start + idx + 1
-            lines.append(self.source[line_start:end])
+            while True:
+                end = value_line_re.match(source, line_start).end()  # type: ignore[union-attr]
+                if not source.startswith("\\", end):
+                    break
+                # escaped line break
+                self.line_pos += 1
+                lines.append(source[line_start:end])
+                line_start = end + 2
+                if source[end + 1] == "\r" and source.startswith("\n", line_start):
+                    line_start += 1
+            self.pos = end
+            lines.append(source[line_start:end])
             self.nl()
             value = "".join(
                 esc_re.sub(esc_parse, line.lstrip("\f\t ")) for line in lines
@@ -189,28 +179,14 @@ class PropertiesParser:
                 # Ignore one space after #, if present.
                 self.pos += 1
             start = self.pos
-            idx = -1
-            for idx, ch in enumerate(self.source[start:]):
-                if ch == "\n" or ch == "\r":
-                    idx -= 1
-                    break
-            end = self.pos = start + idx + 1
+            eol = eol_re.search(self.source, start)
+            end = self.pos = eol.start() if eol else len(self.source)
             self.nl()
             return LineKind.COMMENT, lp, self.source[start:end]
 
         # key
         start = self.pos
-        at_escape = False
-        idx = -1
-        for idx, ch in enumerate(self.source[start:]):
-            if at_escape:
-                at_escape = False
-            elif ch == "\\":
-                at_escape = True
-            elif ch in {"\n", "\r", "\t", "\f", " ", "=", ":"}:
-                idx -= 1
-                break
-        end = self.pos = start + idx + 1
+        end = self.pos = key_re.match(self.source, start).end()  # type: ignore[union-attr]
         self.ws()
         if self.source.startswith(("=", ":"), self.pos):
             self.pos += 1
@@ -231,8 +207,4 @@ class PropertiesParser:
         return False
 
     def ws(self) -> None:
-        for ch in self.source[self.pos :]:
-            if ch in {" ", "\t", "\f"}:
-                self.pos += 1
-            else:
-                break
+        self.pos = ws_re.match(self.source, self.pos).end()  # type: ignore[union-attr]
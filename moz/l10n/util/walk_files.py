@@ -45,19 +45,15 @@ def walk_files(
             pass
     for dir in (join(root, p) for p in dirs) if dirs else (root,):
         for dirpath, dirnames, filenames in walk(dir):
+            rel_dir = relpath(dirpath, start=root)
+            if sep != "/":
+                rel_dir = rel_dir.replace(sep, "/")
+            prefix = "" if rel_dir == "." else rel_dir + "/"
             idx = len(dirnames) - 1
             while idx >= 0:
-                rp = relpath(join(dirpath, dirnames[idx]), start=root)
-                if sep != "/":
-                    rp = rp.replace(sep, "/")
-                if check_match(ignore, rp, is_dir=True):
+                if check_match(ignore, prefix + dirnames[idx], is_dir=True):
                     del dirnames[idx]
                 idx -= 1
             for fn in filenames:
-                path = join(dirpath, fn)
-                rp = relpath(path, start=root)
-                if sep != "/":
-                    rp = rp.replace(sep, "/")
-                if check_match(ignore, rp):
-                    continue
-                yield path
+                if not check_match(ignore, prefix + fn):
+                    yield join(dirpath, fn)
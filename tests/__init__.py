@@ -0,0 +1,74 @@
+# Copyright Mozilla Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from os import W_OK, access, environ, mkdir
+from os.path import isdir, join
+from tempfile import TemporaryDirectory
+from typing import Dict, Union
+from unittest import TestCase
+
+Tree = Dict[str, Union[str, "Tree"]]
+
+# Keep test file trees in memory where a tmpfs is available,
+# unless a temporary directory is explicitly set in the environment.
+_shm = "/dev/shm"
+tmp_base = (
+    _shm
+    if not any(environ.get(name) for name in ("TMPDIR", "TEMP", "TMP"))
+    and isdir(_shm)
+    and access(_shm, W_OK)
+    else None
+)
+
+
+def fast_tempdir() -> TemporaryDirectory[str]:
+    return TemporaryDirectory(dir=tmp_base)
+
+
+def build_file_tree(root: str, tree: Tree) -> None:
+    stack: list[tuple[str, Tree]] = [(root, tree)]
+    while stack:
+        dir, subtree = stack.pop()
+        for name, value in subtree.items():
+            path = join(dir, name)
+            if isinstance(value, dict):
+                mkdir(path)
+                stack.append((path, value))
+            else:
+                with open(path, "x") as file:
+                    if value:
+                        file.write(value)
+
+
+class FileTreeTestCase(TestCase):
+    """
+    Provides each test with its own empty `self.root` directory.
+
+    The directories are created under a temporary directory
+    that is shared by the test case's tests and removed once after all of them.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmpdir = fast_tempdir()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        self.root = join(self._tmpdir.name, self._testMethodName)
+        mkdir(self.root)
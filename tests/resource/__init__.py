@@ -14,7 +14,33 @@
 
 from __future__ import annotations
 
-from moz.l10n.resource.data import LinePos
+from functools import lru_cache
+from importlib_resources import files
+from typing import Any, Callable, Iterable
+
+from moz.l10n.resource.data import LinePos, Resource
+
+data_dir = files("tests.resource.data")
+
+
+@lru_cache(maxsize=None)
+def get_source(filename: str) -> bytes:
+    """
+    Read a test data file, caching its contents for later calls.
+    """
+    return data_dir.joinpath(filename).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def parse_source(
+    parse: Callable[[bytes], Resource[Any, Any]], filename: str
+) -> Resource[Any, Any]:
+    """
+    Parse a test data file with `parse`, caching the result for later calls.
+
+    The parsed resources are shared between tests, so they must not be modified.
+    """
+    return parse(get_source(filename))
 
 
 def get_linepos(
@@ -22,7 +48,7 @@ def get_linepos(
     key: int | None = None,
     value: int | None = None,
     end: int | None = None,
-) -> None:
+) -> LinePos:
     if key is None:
         key = start
     if value is None:
@@ -30,3 +56,23 @@ def get_linepos(
     if end is None:
         end = value + 1
     return LinePos(start, key, value, end)
+
+
+def assert_serialized(chunks: Iterable[str], expected: str) -> None:
+    """
+    Compare serializer output against `expected` chunk by chunk,
+    failing at the first divergence without joining the whole output.
+    """
+    pos = 0
+    for chunk in chunks:
+        end = pos + len(chunk)
+        if expected[pos:end] != chunk:
+            raise AssertionError(
+                f"Serialization differs at offset {pos}: "
+                f"expected {expected[pos:end]!r}, got {chunk!r}"
+            )
+        pos = end
+    if pos != len(expected):
+        raise AssertionError(
+            f"Serialization ends at offset {pos}, expected {expected[pos:]!r}"
+        )
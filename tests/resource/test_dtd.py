@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
 from textwrap import dedent
 from unittest import TestCase
 
@@ -23,8 +22,79 @@ from moz.l10n.resource.data import Comment, Entry, Resource, Section
 from moz.l10n.resource.dtd import dtd_parse, dtd_serialize
 from moz.l10n.resource.format import Format
 
-source = (
-    files("tests.resource.data").joinpath("accounts.dtd").read_bytes().decode("utf-8")
+from . import get_source
+
+source = get_source("accounts.dtd").decode("utf-8")
+
+accounts_serialized = dedent(
+    """\
+    <!-- This Source Code Form is subject to the terms of the Mozilla Public
+       - License, v. 2.0. If a copy of the MPL was not distributed with this
+       - file, You can obtain one at http://mozilla.org/MPL/2.0/. -->
+
+    <!ENTITY foo '"bar"'>
+
+    <!-- This file is originally from:
+         https://searchfox.org/comm-central/rev/1032c05ab3f8f1a7b9b928cc5a79dbf67a9ac48f/chat/locales/en-US/accounts.dtd -->
+
+    <!-- Account manager window for Instantbird -->
+    <!ENTITY accounts.title "Accounts - &brandShortName;">
+    <!-- Instant messaging account status window for Thunderbird -->
+    <!ENTITY accountsWindow.title "Instant messaging status">
+    <!ENTITY accountManager.newAccount.label "New Account">
+    <!ENTITY accountManager.newAccount.accesskey "N">
+    <!ENTITY accountManager.close.label "Close">
+    <!ENTITY accountManager.close.accesskey "l">
+    <!-- This should match account.commandkey in instantbird.dtd -->
+    <!ENTITY accountManager.close.commandkey "a">
+    <!-- This title must be short, displayed with a big font size -->
+    <!ENTITY accountManager.noAccount.title "No account configured yet">
+    <!ENTITY accountManager.noAccount.description "Click on the &accountManager.newAccount.label; button to let &brandShortName; guide you through the process of configuring one.">
+    <!ENTITY account.autoSignOn.label "Sign-on at startup">
+    <!ENTITY account.autoSignOn.accesskey "S">
+    <!ENTITY account.connect.label "Connect">
+    <!ENTITY account.connect.accesskey "o">
+    <!ENTITY account.disconnect.label "Disconnect">
+    <!ENTITY account.disconnect.accesskey "i">
+    <!ENTITY account.edit.label "Properties">
+    <!ENTITY account.edit.accesskey "P">
+    <!ENTITY account.cancelReconnection.label "Cancel reconnection">
+    <!ENTITY account.cancelReconnection.accesskey "A">
+    <!ENTITY account.copyDebugLog.label "Copy Debug Log">
+    <!ENTITY account.copyDebugLog.accesskey "C">
+    <!ENTITY account.connecting "Connecting…">
+    <!ENTITY account.disconnecting "Disconnecting…">
+    <!ENTITY account.disconnected "Not Connected">
+    """
+)
+
+accounts_trimmed = dedent(
+    """\
+    <!ENTITY accounts.title "Accounts - &brandShortName;">
+    <!ENTITY accountsWindow.title "Instant messaging status">
+    <!ENTITY accountManager.newAccount.label "New Account">
+    <!ENTITY accountManager.newAccount.accesskey "N">
+    <!ENTITY accountManager.close.label "Close">
+    <!ENTITY accountManager.close.accesskey "l">
+    <!ENTITY accountManager.close.commandkey "a">
+    <!ENTITY accountManager.noAccount.title "No account configured yet">
+    <!ENTITY accountManager.noAccount.description "Click on the &accountManager.newAccount.label; button to let &brandShortName; guide you through the process of configuring one.">
+    <!ENTITY account.autoSignOn.label "Sign-on at startup">
+    <!ENTITY account.autoSignOn.accesskey "S">
+    <!ENTITY account.connect.label "Connect">
+    <!ENTITY account.connect.accesskey "o">
+    <!ENTITY account.disconnect.label "Disconnect">
+    <!ENTITY account.disconnect.accesskey "i">
+    <!ENTITY account.edit.label "Properties">
+    <!ENTITY account.edit.accesskey "P">
+    <!ENTITY account.cancelReconnection.label "Cancel reconnection">
+    <!ENTITY account.cancelReconnection.accesskey "A">
+    <!ENTITY account.copyDebugLog.label "Copy Debug Log">
+    <!ENTITY account.copyDebugLog.accesskey "C">
+    <!ENTITY account.connecting "Connecting…">
+    <!ENTITY account.disconnecting "Disconnecting…">
+    <!ENTITY account.disconnected "Not Connected">
+    """
 )
 
 
@@ -135,78 +205,11 @@ class TestDtd(TestCase):
     def test_serialize(self):
         res = dtd_parse(source)
         res.sections[0].entries.insert(0, Entry(("foo",), '"bar"'))
-        assert "".join(dtd_serialize(res)) == dedent(
-            """\
-            <!-- This Source Code Form is subject to the terms of the Mozilla Public
-               - License, v. 2.0. If a copy of the MPL was not distributed with this
-               - file, You can obtain one at http://mozilla.org/MPL/2.0/. -->
-
-            <!ENTITY foo '"bar"'>
-
-            <!-- This file is originally from:
-                 https://searchfox.org/comm-central/rev/1032c05ab3f8f1a7b9b928cc5a79dbf67a9ac48f/chat/locales/en-US/accounts.dtd -->
-
-            <!-- Account manager window for Instantbird -->
-            <!ENTITY accounts.title "Accounts - &brandShortName;">
-            <!-- Instant messaging account status window for Thunderbird -->
-            <!ENTITY accountsWindow.title "Instant messaging status">
-            <!ENTITY accountManager.newAccount.label "New Account">
-            <!ENTITY accountManager.newAccount.accesskey "N">
-            <!ENTITY accountManager.close.label "Close">
-            <!ENTITY accountManager.close.accesskey "l">
-            <!-- This should match account.commandkey in instantbird.dtd -->
-            <!ENTITY accountManager.close.commandkey "a">
-            <!-- This title must be short, displayed with a big font size -->
-            <!ENTITY accountManager.noAccount.title "No account configured yet">
-            <!ENTITY accountManager.noAccount.description "Click on the &accountManager.newAccount.label; button to let &brandShortName; guide you through the process of configuring one.">
-            <!ENTITY account.autoSignOn.label "Sign-on at startup">
-            <!ENTITY account.autoSignOn.accesskey "S">
-            <!ENTITY account.connect.label "Connect">
-            <!ENTITY account.connect.accesskey "o">
-            <!ENTITY account.disconnect.label "Disconnect">
-            <!ENTITY account.disconnect.accesskey "i">
-            <!ENTITY account.edit.label "Properties">
-            <!ENTITY account.edit.accesskey "P">
-            <!ENTITY account.cancelReconnection.label "Cancel reconnection">
-            <!ENTITY account.cancelReconnection.accesskey "A">
-            <!ENTITY account.copyDebugLog.label "Copy Debug Log">
-            <!ENTITY account.copyDebugLog.accesskey "C">
-            <!ENTITY account.connecting "Connecting…">
-            <!ENTITY account.disconnecting "Disconnecting…">
-            <!ENTITY account.disconnected "Not Connected">
-            """
-        )
+        assert "".join(dtd_serialize(res)) == accounts_serialized
 
     def test_trim_comments(self):
         res = dtd_parse(source)
-        assert "".join(dtd_serialize(res, trim_comments=True)) == dedent(
-            """\
-            <!ENTITY accounts.title "Accounts - &brandShortName;">
-            <!ENTITY accountsWindow.title "Instant messaging status">
-            <!ENTITY accountManager.newAccount.label "New Account">
-            <!ENTITY accountManager.newAccount.accesskey "N">
-            <!ENTITY accountManager.close.label "Close">
-            <!ENTITY accountManager.close.accesskey "l">
-            <!ENTITY accountManager.close.commandkey "a">
-            <!ENTITY accountManager.noAccount.title "No account configured yet">
-            <!ENTITY accountManager.noAccount.description "Click on the &accountManager.newAccount.label; button to let &brandShortName; guide you through the process of configuring one.">
-            <!ENTITY account.autoSignOn.label "Sign-on at startup">
-            <!ENTITY account.autoSignOn.accesskey "S">
-            <!ENTITY account.connect.label "Connect">
-            <!ENTITY account.connect.accesskey "o">
-            <!ENTITY account.disconnect.label "Disconnect">
-            <!ENTITY account.disconnect.accesskey "i">
-            <!ENTITY account.edit.label "Properties">
-            <!ENTITY account.edit.accesskey "P">
-            <!ENTITY account.cancelReconnection.label "Cancel reconnection">
-            <!ENTITY account.cancelReconnection.accesskey "A">
-            <!ENTITY account.copyDebugLog.label "Copy Debug Log">
-            <!ENTITY account.copyDebugLog.accesskey "C">
-            <!ENTITY account.connecting "Connecting…">
-            <!ENTITY account.disconnecting "Disconnecting…">
-            <!ENTITY account.disconnected "Not Connected">
-            """
-        )
+        assert "".join(dtd_serialize(res, trim_comments=True)) == accounts_trimmed
 
     def test_invalid_key(self):
         res = dtd_parse(source)
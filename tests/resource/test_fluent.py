@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
 from textwrap import dedent
 from unittest import TestCase
 
@@ -32,7 +31,253 @@ from moz.l10n.resource.data import Comment, Entry, LinePos, Metadata, Resource,
 from moz.l10n.resource.fluent import fluent_parse, fluent_serialize
 from moz.l10n.resource.format import Format
 
-from . import get_linepos
+from . import get_linepos, get_source
+
+resource_serialized = dedent(
+    """\
+    ### Resource Comment
+
+
+    ## Group Comment
+
+    simple = A
+
+    # Standalone Comment
+
+
+    ##
+
+    # Message Comment
+    # on two lines.
+    expressions = A { $arg } B { msg.foo } C { -term(x: 42) }
+    functions = { NUMBER($arg) }{ FOO("bar", opt: "val") }
+    has-attr = ABC
+        .attr = Attr
+    # Attr Comment
+    has-only-attr =
+        .attr = Attr
+    single-sel =
+        { $num ->
+            [one] One
+           *[other] Other
+        }
+    two-sels =
+        { $a ->
+            [1]
+                { $b ->
+                    [cc] pre One mid CC post
+                   *[bb] pre One mid BB post
+                }
+           *[2]
+                { $b ->
+                    [cc] pre Two mid CC post
+                   *[bb] pre Two mid BB post
+                }
+        }
+    deep-sels =
+        { $a ->
+            [0]
+                { $b ->
+                    [one] { "" }
+                   *[other] 0,x
+                }
+            [one]
+                { $b ->
+                    [one] { "1,1" }
+                   *[other] 1,x
+                }
+           *[other]
+                { $b ->
+                    [0] x,0
+                    [one] x,1
+                   *[other] x,x
+                }
+        }
+    -term = Term
+        .attr = foo
+    term-sel =
+        { -term.attr ->
+            [foo] Foo
+           *[other] Other
+        }
+    """
+)
+
+resource_trimmed = dedent(
+    """\
+    simple = A
+    expressions = A { $arg } B { msg.foo } C { -term(x: 42) }
+    functions = { NUMBER($arg) }{ FOO("bar", opt: "val") }
+    has-attr = ABC
+        .attr = Attr
+    has-only-attr =
+        .attr = Attr
+    single-sel =
+        { $num ->
+            [one] One
+           *[other] Other
+        }
+    two-sels =
+        { $a ->
+            [1]
+                { $b ->
+                    [cc] pre One mid CC post
+                   *[bb] pre One mid BB post
+                }
+           *[2]
+                { $b ->
+                    [cc] pre Two mid CC post
+                   *[bb] pre Two mid BB post
+                }
+        }
+    deep-sels =
+        { $a ->
+            [0]
+                { $b ->
+                    [one] { "" }
+                   *[other] 0,x
+                }
+            [one]
+                { $b ->
+                    [one] { "1,1" }
+                   *[other] 1,x
+                }
+           *[other]
+                { $b ->
+                    [0] x,0
+                    [one] x,1
+                   *[other] x,x
+                }
+        }
+    -term = Term
+        .attr = foo
+    term-sel =
+        { -term.attr ->
+            [foo] Foo
+           *[other] Other
+        }
+    """
+)
+
+demo_serialized = dedent(
+    """\
+    # Any copyright is dedicated to the Public Domain.
+    # http://creativecommons.org/publicdomain/zero/1.0/
+
+
+    ### Resource Comment
+
+    # Simple string
+    title = About Localization
+    # Multiline string: press Shift + Enter to insert new line
+    feedbackUninstallCopy =
+        Your participation in Firefox Test Pilot means
+        a lot! Please check out our other experiments,
+        and stay tuned for more to come.
+    # Attributes: in original string
+    emailOptInInput =
+        .placeholder = email goes here :)
+    # Attributes: access keys
+    file-menu =
+        .label = File
+        .accesskey = F
+    other-file-menu =
+        .aria-label = { file-menu.label }
+        .accesskey = { file-menu.accesskey }
+    # Value and an attribute
+    shotIndexNoExpirationSymbol = ∞
+        .title = This shot does not expire
+    # Plurals
+    delete-all-message =
+        { $num ->
+            [one] Delete this download?
+           *[other] Delete { $num } downloads?
+        }
+    # Plurals with custom values
+    delete-all-message-special-cases =
+        { $num ->
+            [1] Delete this download?
+            [2] Delete this pair of downloads?
+            [12] Delete this dozen of downloads?
+           *[other] Delete { $num } downloads?
+        }
+    # DATETIME Built-in function
+    today-is = Today is { DATETIME($date, month: "long", year: "numeric", day: "numeric") }
+    # Soft Launch
+    default-content-process-count =
+        .label = { $num } (default)
+    # PLATFORM() selector
+    platform =
+        { PLATFORM() ->
+            [win] Options
+           *[other] Preferences
+        }
+    # NUMBER() selector
+    number =
+        { NUMBER($var, type: "ordinal") ->
+            [1] first
+            [one] { $var }st
+           *[other] { $var }nd
+        }
+    # PLATFORM() selector in attribute
+    platform-attribute =
+        .title =
+            { PLATFORM() ->
+                [win] Options
+               *[other] Preferences
+            }
+    # Double selector in attributes
+    download-choose-folder =
+        .label =
+            { PLATFORM() ->
+                [macos] Choose…
+               *[other] Browse…
+            }
+        .accesskey =
+            { PLATFORM() ->
+                [macos] e
+               *[other] o
+            }
+    # Multiple selectors
+    selector-multi =
+        { $num ->
+            [one]
+                { $gender ->
+                    [feminine] There is one email for her
+                   *[masculine] There is one email for him
+                }
+           *[other]
+                { $gender ->
+                    [feminine] There are many emails for her
+                   *[masculine] There are many emails for him
+                }
+        }
+    # Term
+    -term = Term
+    # TermReference
+    term-reference = Term { -term } Reference
+    # StringExpression
+    string-expression = { "" }
+    # NumberExpression
+    number-expression = { 5 }
+    # MessageReference with attribute (was: AttributeExpression)
+    attribute-expression = { my_id.title }
+    # Nested selectors
+    selector-nested =
+        { $gender ->
+            [masculine]
+                { $num ->
+                    [one] There is one email for him
+                   *[other] There are many emails for him
+                }
+           *[feminine]
+                { $num ->
+                    [one] There is one email for her
+                   *[other] There are many emails for her
+                }
+        }
+    """
+)
 
 
 class TestFluent(TestCase):
@@ -257,130 +502,8 @@ class TestFluent(TestCase):
             ],
             comment="Resource Comment",
         )
-        assert "".join(fluent_serialize(res)) == dedent(
-            """\
-            ### Resource Comment
-
-
-            ## Group Comment
-
-            simple = A
-
-            # Standalone Comment
-
-
-            ##
-
-            # Message Comment
-            # on two lines.
-            expressions = A { $arg } B { msg.foo } C { -term(x: 42) }
-            functions = { NUMBER($arg) }{ FOO("bar", opt: "val") }
-            has-attr = ABC
-                .attr = Attr
-            # Attr Comment
-            has-only-attr =
-                .attr = Attr
-            single-sel =
-                { $num ->
-                    [one] One
-                   *[other] Other
-                }
-            two-sels =
-                { $a ->
-                    [1]
-                        { $b ->
-                            [cc] pre One mid CC post
-                           *[bb] pre One mid BB post
-                        }
-                   *[2]
-                        { $b ->
-                            [cc] pre Two mid CC post
-                           *[bb] pre Two mid BB post
-                        }
-                }
-            deep-sels =
-                { $a ->
-                    [0]
-                        { $b ->
-                            [one] { "" }
-                           *[other] 0,x
-                        }
-                    [one]
-                        { $b ->
-                            [one] { "1,1" }
-                           *[other] 1,x
-                        }
-                   *[other]
-                        { $b ->
-                            [0] x,0
-                            [one] x,1
-                           *[other] x,x
-                        }
-                }
-            -term = Term
-                .attr = foo
-            term-sel =
-                { -term.attr ->
-                    [foo] Foo
-                   *[other] Other
-                }
-            """
-        )
-        assert "".join(fluent_serialize(res, trim_comments=True)) == dedent(
-            """\
-            simple = A
-            expressions = A { $arg } B { msg.foo } C { -term(x: 42) }
-            functions = { NUMBER($arg) }{ FOO("bar", opt: "val") }
-            has-attr = ABC
-                .attr = Attr
-            has-only-attr =
-                .attr = Attr
-            single-sel =
-                { $num ->
-                    [one] One
-                   *[other] Other
-                }
-            two-sels =
-                { $a ->
-                    [1]
-                        { $b ->
-                            [cc] pre One mid CC post
-                           *[bb] pre One mid BB post
-                        }
-                   *[2]
-                        { $b ->
-                            [cc] pre Two mid CC post
-                           *[bb] pre Two mid BB post
-                        }
-                }
-            deep-sels =
-                { $a ->
-                    [0]
-                        { $b ->
-                            [one] { "" }
-                           *[other] 0,x
-                        }
-                    [one]
-                        { $b ->
-                            [one] { "1,1" }
-                           *[other] 1,x
-                        }
-                   *[other]
-                        { $b ->
-                            [0] x,0
-                            [one] x,1
-                           *[other] x,x
-                        }
-                }
-            -term = Term
-                .attr = foo
-            term-sel =
-                { -term.attr ->
-                    [foo] Foo
-                   *[other] Other
-                }
-                """
-        )
+        assert "".join(fluent_serialize(res)) == resource_serialized
+        assert "".join(fluent_serialize(res, trim_comments=True)) == resource_trimmed
 
     def test_escapes(self):
         source = 'key = { "" } { "\t" } { "\\u000a" }'
@@ -465,8 +588,7 @@ class TestFluent(TestCase):
             fluent_parse("msg = value\n# Comment\nLine of junk", as_ftl_patterns=True)
 
     def test_file(self):
-        bytes = files("tests.resource.data").joinpath("demo.ftl").read_bytes()
-        res = fluent_parse(bytes, with_linepos=False)
+        res = fluent_parse(get_source("demo.ftl"), with_linepos=False)
         copyright = "Any copyright is dedicated to the Public Domain.\nhttp://creativecommons.org/publicdomain/zero/1.0/"
         entries = [
             Entry(
@@ -719,122 +841,4 @@ class TestFluent(TestCase):
             comment="Resource Comment",
             sections=[Section(id=(), entries=entries)],
         )
-        assert "".join(fluent_serialize(res)) == dedent(
-            """\
-            # Any copyright is dedicated to the Public Domain.
-            # http://creativecommons.org/publicdomain/zero/1.0/
-
-
-            ### Resource Comment
-
-            # Simple string
-            title = About Localization
-            # Multiline string: press Shift + Enter to insert new line
-            feedbackUninstallCopy =
-                Your participation in Firefox Test Pilot means
-                a lot! Please check out our other experiments,
-                and stay tuned for more to come.
-            # Attributes: in original string
-            emailOptInInput =
-                .placeholder = email goes here :)
-            # Attributes: access keys
-            file-menu =
-                .label = File
-                .accesskey = F
-            other-file-menu =
-                .aria-label = { file-menu.label }
-                .accesskey = { file-menu.accesskey }
-            # Value and an attribute
-            shotIndexNoExpirationSymbol = ∞
-                .title = This shot does not expire
-            # Plurals
-            delete-all-message =
-                { $num ->
-                    [one] Delete this download?
-                   *[other] Delete { $num } downloads?
-                }
-            # Plurals with custom values
-            delete-all-message-special-cases =
-                { $num ->
-                    [1] Delete this download?
-                    [2] Delete this pair of downloads?
-                    [12] Delete this dozen of downloads?
-                   *[other] Delete { $num } downloads?
-                }
-            # DATETIME Built-in function
-            today-is = Today is { DATETIME($date, month: "long", year: "numeric", day: "numeric") }
-            # Soft Launch
-            default-content-process-count =
-                .label = { $num } (default)
-            # PLATFORM() selector
-            platform =
-                { PLATFORM() ->
-                    [win] Options
-                   *[other] Preferences
-                }
-            # NUMBER() selector
-            number =
-                { NUMBER($var, type: "ordinal") ->
-                    [1] first
-                    [one] { $var }st
-                   *[other] { $var }nd
-                }
-            # PLATFORM() selector in attribute
-            platform-attribute =
-                .title =
-                    { PLATFORM() ->
-                        [win] Options
-                       *[other] Preferences
-                    }
-            # Double selector in attributes
-            download-choose-folder =
-                .label =
-                    { PLATFORM() ->
-                        [macos] Choose…
-                       *[other] Browse…
-                    }
-                .accesskey =
-                    { PLATFORM() ->
-                        [macos] e
-                       *[other] o
-                    }
-            # Multiple selectors
-            selector-multi =
-                { $num ->
-                    [one]
-                        { $gender ->
-                            [feminine] There is one email for her
-                           *[masculine] There is one email for him
-                        }
-                   *[other]
-                        { $gender ->
-                            [feminine] There are many emails for her
-                           *[masculine] There are many emails for him
-                        }
-                }
-            # Term
-            -term = Term
-            # TermReference
-            term-reference = Term { -term } Reference
-            # StringExpression
-            string-expression = { "" }
-            # NumberExpression
-            number-expression = { 5 }
-            # MessageReference with attribute (was: AttributeExpression)
-            attribute-expression = { my_id.title }
-            # Nested selectors
-            selector-nested =
-                { $gender ->
-                    [masculine]
-                        { $num ->
-                            [one] There is one email for him
-                           *[other] There are many emails for him
-                        }
-                   *[feminine]
-                        { $num ->
-                            [one] There is one email for her
-                           *[other] There are many emails for her
-                        }
-                }
-            """
-        )
+        assert "".join(fluent_serialize(res)) == demo_serialized
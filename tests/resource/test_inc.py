@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
 from textwrap import dedent
 from unittest import TestCase
 
@@ -23,8 +22,37 @@ from moz.l10n.resource.data import Comment, Entry, Resource, Section
 from moz.l10n.resource.format import Format
 from moz.l10n.resource.inc import inc_parse, inc_serialize
 
-source = (
-    files("tests.resource.data").joinpath("defines.inc").read_bytes().decode("utf-8")
+from . import get_source
+
+source = get_source("defines.inc").decode("utf-8")
+
+defines_serialized = dedent(
+    """\
+    #filter emptyLines
+
+    #define MOZ_LANGPACK_CREATOR SeaMonkey e.V.
+
+    # If non-English locales wish to credit multiple contributors, uncomment this
+    # variable definition and use the format specified.
+    # #define MOZ_LANGPACK_CONTRIBUTORS <em:contributor>Joe Solon</em:contributor> <em:contributor>Suzy Solon</em:contributor>
+
+    # LOCALIZATION NOTE (seamonkey):
+    # link title for https://www.seamonkey-project.org/ (in the personal toolbar)
+    #define seamonkey SeaMonkey
+
+    #unfilter emptyLines\n\n"""
+)
+
+defines_trimmed = dedent(
+    """\
+    #filter emptyLines
+
+    #define MOZ_LANGPACK_CREATOR SeaMonkey e.V.
+
+
+    #define seamonkey SeaMonkey
+
+    #unfilter emptyLines\n\n"""
 )
 
 
@@ -61,33 +89,8 @@ class TestInc(TestCase):
 
     def test_serialize(self):
         res = inc_parse(source)
-        assert "".join(inc_serialize(res)) == dedent(
-            """\
-            #filter emptyLines
-
-            #define MOZ_LANGPACK_CREATOR SeaMonkey e.V.
-
-            # If non-English locales wish to credit multiple contributors, uncomment this
-            # variable definition and use the format specified.
-            # #define MOZ_LANGPACK_CONTRIBUTORS <em:contributor>Joe Solon</em:contributor> <em:contributor>Suzy Solon</em:contributor>
-
-            # LOCALIZATION NOTE (seamonkey):
-            # link title for https://www.seamonkey-project.org/ (in the personal toolbar)
-            #define seamonkey SeaMonkey
-
-            #unfilter emptyLines\n\n"""
-        )
+        assert "".join(inc_serialize(res)) == defines_serialized
 
     def test_trim_comments(self):
         res = inc_parse(source)
-        assert "".join(inc_serialize(res, trim_comments=True)) == dedent(
-            """\
-            #filter emptyLines
-
-            #define MOZ_LANGPACK_CREATOR SeaMonkey e.V.
-
-
-            #define seamonkey SeaMonkey
-
-            #unfilter emptyLines\n\n"""
-        )
+        assert "".join(inc_serialize(res, trim_comments=True)) == defines_trimmed
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 from importlib.util import find_spec
-from importlib_resources import files
 from unittest import TestCase, skipIf
 
 from moz.l10n.resource import (
@@ -26,11 +25,9 @@ from moz.l10n.resource import (
 )
 from moz.l10n.resource.data import Resource
 
-no_xml = find_spec("lxml") is None
-
+from . import get_source
 
-def get_source(filename: str) -> bytes:
-    return files("tests.resource.data").joinpath(filename).read_bytes()
+no_xml = find_spec("lxml") is None
 
 
 class TesteParseResource(TestCase):
@@ -45,12 +42,14 @@ class TesteParseResource(TestCase):
             "test.properties",
         )
         for file in data:
-            res = parse_resource(file, get_source(file))
-            assert isinstance(res, Resource)
-            assert all(isinstance(s, str) for s in serialize_resource(res))
-            assert all(
-                isinstance(s, str) for s in serialize_resource(res, trim_comments=True)
-            )
+            with self.subTest(file=file):
+                res = parse_resource(file, get_source(file))
+                assert isinstance(res, Resource)
+                assert all(isinstance(s, str) for s in serialize_resource(res))
+                assert all(
+                    isinstance(s, str)
+                    for s in serialize_resource(res, trim_comments=True)
+                )
 
     @skipIf(no_xml, "Requires [xml] extra")
     def test_named_xml_files(self):
@@ -62,12 +61,14 @@ class TesteParseResource(TestCase):
             "xcode.xliff",
         )
         for file in data:
-            res = parse_resource(file, get_source(file))
-            assert isinstance(res, Resource)
-            assert all(isinstance(s, str) for s in serialize_resource(res))
-            assert all(
-                isinstance(s, str) for s in serialize_resource(res, trim_comments=True)
-            )
+            with self.subTest(file=file):
+                res = parse_resource(file, get_source(file))
+                assert isinstance(res, Resource)
+                assert all(isinstance(s, str) for s in serialize_resource(res))
+                assert all(
+                    isinstance(s, str)
+                    for s in serialize_resource(res, trim_comments=True)
+                )
 
     @skipIf(no_xml, "Requires [xml] extra")
     def test_parse_anon_files(self):
@@ -83,9 +84,10 @@ class TesteParseResource(TestCase):
         }
         for format, values in data.items():
             for file in values:
-                res = parse_resource(None, get_source(file))
-                assert isinstance(res, Resource)
-                assert res.format == format
+                with self.subTest(file=file):
+                    res = parse_resource(None, get_source(file))
+                    assert isinstance(res, Resource)
+                    assert res.format == format
 
     def test_parse_unknown_format(self):
         source = get_source("accounts.dtd")
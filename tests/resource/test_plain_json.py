@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
 from textwrap import dedent
 from unittest import TestCase
 
@@ -23,12 +22,48 @@ from moz.l10n.resource.data import Entry, Resource, Section
 from moz.l10n.resource.format import Format
 from moz.l10n.resource.plain_json import plain_json_parse, plain_json_serialize
 
-source = files("tests.resource.data").joinpath("messages.json").read_bytes()
+from . import parse_source
+
+messages_serialized = dedent(
+    """\
+    {
+      "SourceString": {
+        "message": "Translated String",
+        "description": "Sample comment"
+      },
+      "MultipleComments": {
+        "message": "Translated Multiple Comments",
+        "description": "Second comment"
+      },
+      "NoCommentsorSources": {
+        "message": "Translated No Comments or Sources"
+      },
+      "placeholders": {
+        "message": "Hello$$$ $1YOUR_NAME$ at $2",
+        "description": "Peer greeting",
+        "placeholders": {
+          "1your_name": {
+            "content": "$1",
+            "example": "Cira"
+          }
+        }
+      },
+      "repeated_ref": {
+        "message": "$foo$ and $Foo$",
+        "placeholders": {
+          "foo": {
+            "content": "$1"
+          }
+        }
+      }
+    }
+    """
+)
 
 
 class TestPlain(TestCase):
     def test_parse(self):
-        res = plain_json_parse(source)
+        res = parse_source(plain_json_parse, "messages.json")
         assert res == Resource(
             Format.plain_json,
             [
@@ -95,39 +130,5 @@ class TestPlain(TestCase):
         )
 
     def test_serialize(self):
-        res = plain_json_parse(source)
-        assert "".join(plain_json_serialize(res)) == dedent(
-            """\
-            {
-              "SourceString": {
-                "message": "Translated String",
-                "description": "Sample comment"
-              },
-              "MultipleComments": {
-                "message": "Translated Multiple Comments",
-                "description": "Second comment"
-              },
-              "NoCommentsorSources": {
-                "message": "Translated No Comments or Sources"
-              },
-              "placeholders": {
-                "message": "Hello$$$ $1YOUR_NAME$ at $2",
-                "description": "Peer greeting",
-                "placeholders": {
-                  "1your_name": {
-                    "content": "$1",
-                    "example": "Cira"
-                  }
-                }
-              },
-              "repeated_ref": {
-                "message": "$foo$ and $Foo$",
-                "placeholders": {
-                  "foo": {
-                    "content": "$1"
-                  }
-                }
-              }
-            }
-            """
-        )
+        res = parse_source(plain_json_parse, "messages.json")
+        assert "".join(plain_json_serialize(res)) == messages_serialized
@@ -14,7 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
 from unittest import TestCase
 
 from moz.l10n.message import (
@@ -28,12 +27,14 @@ from moz.l10n.resource.data import Entry, Metadata, Resource, Section
 from moz.l10n.resource.format import Format
 from moz.l10n.resource.po import po_parse, po_serialize
 
-source = files("tests.resource.data").joinpath("foo.po").read_bytes().decode("utf-8")
+from . import assert_serialized, get_source, parse_source
+
+source = get_source("foo.po")
 
 
 class TestPo(TestCase):
     def test_parse(self):
-        res = po_parse(source)
+        res = parse_source(po_parse, "foo.po")
         assert res == Resource(
             Format.po,
             comment="Test translation file.\n"
@@ -105,10 +106,10 @@ class TestPo(TestCase):
         )
 
     def test_serialize(self):
-        res = po_parse(source)
-        assert (
-            "".join(po_serialize(res))
-            == r"""# Test translation file.
+        res = parse_source(po_parse, "foo.po")
+        assert_serialized(
+            po_serialize(res),
+            r"""# Test translation file.
 # Any copyright is dedicated to the Public Domain.
 # http://creativecommons.org/publicdomain/zero/1.0/
 #
@@ -146,14 +147,14 @@ msgstr "translated string"
 msgctxt "context"
 msgid "original string"
 msgstr "translated string"
-"""
+""",
         )
 
     def test_trim_comments(self):
-        res = po_parse(source)
-        assert (
-            "".join(po_serialize(res, trim_comments=True))
-            == r"""#
+        res = parse_source(po_parse, "foo.po")
+        assert_serialized(
+            po_serialize(res, trim_comments=True),
+            r"""#
 msgid ""
 msgstr ""
 "Project-Id-Version: foo\n"
@@ -183,16 +184,16 @@ msgstr "translated string"
 msgctxt "context"
 msgid "original string"
 msgstr "translated string"
-"""
+""",
         )
 
     def test_obsolete(self):
         res = po_parse(source)
         res.sections[0].entries[0].meta.append(Metadata("obsolete", True))
         res.sections[0].entries[2].meta = []
-        assert (
-            "".join(po_serialize(res))
-            == r"""# Test translation file.
+        assert_serialized(
+            po_serialize(res),
+            r"""# Test translation file.
 # Any copyright is dedicated to the Public Domain.
 # http://creativecommons.org/publicdomain/zero/1.0/
 #
@@ -230,5 +231,5 @@ msgstr "translated string"
 msgctxt "context"
 msgid "original string"
 msgstr "translated string"
-"""
+""",
         )
@@ -14,8 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
-from textwrap import dedent
 from unittest import TestCase
 
 from moz.l10n.message import Declaration, Expression, PatternMessage, VariableRef
@@ -23,12 +21,76 @@ from moz.l10n.resource.data import Entry, Resource, Section
 from moz.l10n.resource.format import Format
 from moz.l10n.resource.webext import webext_parse, webext_serialize
 
-source = files("tests.resource.data").joinpath("messages.json").read_bytes()
+from . import assert_serialized, parse_source
+
+messages_serialized = """\
+{
+  "SourceString": {
+    "message": "Translated String",
+    "description": "Sample comment"
+  },
+  "MultipleComments": {
+    "message": "Translated Multiple Comments",
+    "description": "Second comment"
+  },
+  "NoCommentsorSources": {
+    "message": "Translated No Comments or Sources"
+  },
+  "placeholders": {
+    "message": "Hello$$$ $1YOUR_NAME$ at $2",
+    "description": "Peer greeting",
+    "placeholders": {
+      "1YOUR_NAME": {
+        "content": "$1",
+        "example": "Cira"
+      }
+    }
+  },
+  "repeated_ref": {
+    "message": "$foo$ and $Foo$",
+    "placeholders": {
+      "foo": {
+        "content": "$1"
+      }
+    }
+  }
+}
+"""
+
+messages_trimmed = """\
+{
+  "SourceString": {
+    "message": "Translated String"
+  },
+  "MultipleComments": {
+    "message": "Translated Multiple Comments"
+  },
+  "NoCommentsorSources": {
+    "message": "Translated No Comments or Sources"
+  },
+  "placeholders": {
+    "message": "Hello$$$ $1YOUR_NAME$ at $2",
+    "placeholders": {
+      "1YOUR_NAME": {
+        "content": "$1"
+      }
+    }
+  },
+  "repeated_ref": {
+    "message": "$foo$ and $Foo$",
+    "placeholders": {
+      "foo": {
+        "content": "$1"
+      }
+    }
+  }
+}
+"""
 
 
 class TestWebext(TestCase):
     def test_parse(self):
-        res = webext_parse(source)
+        res = parse_source(webext_parse, "messages.json")
         assert res == Resource(
             Format.webext,
             [
@@ -110,75 +172,9 @@ class TestWebext(TestCase):
         )
 
     def test_serialize(self):
-        res = webext_parse(source)
-        ser = "".join(webext_serialize(res))
-        assert ser == dedent(
-            """\
-            {
-              "SourceString": {
-                "message": "Translated String",
-                "description": "Sample comment"
-              },
-              "MultipleComments": {
-                "message": "Translated Multiple Comments",
-                "description": "Second comment"
-              },
-              "NoCommentsorSources": {
-                "message": "Translated No Comments or Sources"
-              },
-              "placeholders": {
-                "message": "Hello$$$ $1YOUR_NAME$ at $2",
-                "description": "Peer greeting",
-                "placeholders": {
-                  "1YOUR_NAME": {
-                    "content": "$1",
-                    "example": "Cira"
-                  }
-                }
-              },
-              "repeated_ref": {
-                "message": "$foo$ and $Foo$",
-                "placeholders": {
-                  "foo": {
-                    "content": "$1"
-                  }
-                }
-              }
-            }
-            """
-        )
+        res = parse_source(webext_parse, "messages.json")
+        assert_serialized(webext_serialize(res), messages_serialized)
 
     def test_trim_comments(self):
-        res = webext_parse(source)
-        ser = "".join(webext_serialize(res, trim_comments=True))
-        assert ser == dedent(
-            """\
-            {
-              "SourceString": {
-                "message": "Translated String"
-              },
-              "MultipleComments": {
-                "message": "Translated Multiple Comments"
-              },
-              "NoCommentsorSources": {
-                "message": "Translated No Comments or Sources"
-              },
-              "placeholders": {
-                "message": "Hello$$$ $1YOUR_NAME$ at $2",
-                "placeholders": {
-                  "1YOUR_NAME": {
-                    "content": "$1"
-                  }
-                }
-              },
-              "repeated_ref": {
-                "message": "$foo$ and $Foo$",
-                "placeholders": {
-                  "foo": {
-                    "content": "$1"
-                  }
-                }
-              }
-            }
-            """
-        )
+        res = parse_source(webext_parse, "messages.json")
+        assert_serialized(webext_serialize(res, trim_comments=True), messages_trimmed)
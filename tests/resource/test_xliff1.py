@@ -14,8 +14,6 @@
 
 from __future__ import annotations
 
-from importlib_resources import files
-from textwrap import dedent
 from unittest import SkipTest, TestCase
 
 from moz.l10n.message import (
@@ -30,21 +28,232 @@ from moz.l10n.message import (
 from moz.l10n.resource.data import Comment, Entry, Metadata, Resource, Section
 from moz.l10n.resource.format import Format
 
+from . import assert_serialized, parse_source
+
 try:
     from moz.l10n.resource.xliff import xliff_parse, xliff_serialize
 except ImportError:
     raise SkipTest("Requires [xml] extra")
 
 
-hello = files("tests.resource.data").joinpath("hello.xliff").read_bytes()
-angular = files("tests.resource.data").joinpath("angular.xliff").read_bytes()
-icu_docs = files("tests.resource.data").joinpath("icu-docs.xliff").read_bytes()
-xcode = files("tests.resource.data").joinpath("xcode.xliff").read_bytes()
+hello_serialized = """\
+<?xml version="1.0" encoding="utf-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">
+  <file original="hello.txt" source-language="en" target-language="fr" datatype="plaintext">
+    <body>
+      <trans-unit id="hi">
+        <source>Hello world</source>
+        <target>Bonjour le monde</target>
+        <alt-trans>
+          <target xml:lang="es">Hola mundo</target>
+        </alt-trans>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>
+"""
+
+angular_serialized = """\
+<?xml version="1.0" encoding="utf-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">
+  <file original="ng2.template" source-language="en" target-language="fi" datatype="plaintext">
+    <body>
+      <trans-unit id="introductionHeader" datatype="html">
+        <source>
+  Hello i18n!
+</source>
+        <target>
+  Hei i18n!
+</target>
+        <context-group purpose="location">
+          <context context-type="sourcefile">app/app.component.ts</context>
+          <context context-type="linenumber">3</context>
+        </context-group>
+        <note priority="1" from="description">An introduction header for this sample</note>
+        <note priority="1" from="meaning">User welcome</note>
+      </trans-unit>
+      <trans-unit id="icu_plural" datatype="html">
+        <source>{VAR_PLURAL, plural, =0 {just now} =1 {one minute ago} other {<x id="INTERPOLATION" equiv-text="{{minutes}}"/> minutes ago} }</source>
+        <target>{VAR_PLURAL, plural, =0 {juuri nyt} =1 {minuutti sitten} other {<x id="INTERPOLATION" equiv-text="{{minutes}}"/> minuuttia sitten} }</target>
+        <note></note>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>
+"""
+
+icu_docs_serialized = """\
+<?xml version="1.0" encoding="utf-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 xliff-core-1.2-transitional.xsd">
+  <file original="en.txt" xml:space="preserve" source-language="en" datatype="x-icu-resource-bundle" date="2007-06-15T23:20:43Z">
+    <header>
+      <tool tool-id="genrb-3.3-icu-3.7.1" tool-name="genrb"/>
+    </header>
+    <body>
+      <group id="en" restype="x-icu-table">
+        <!-- The resources for a fictious Hello World application. The application displays a single window with a logo and the hello message. -->
+        <trans-unit id="authors" resname="authors" restype="x-icu-alias">
+          <source>root/authors</source>
+          <target/>
+        </trans-unit>
+        <trans-unit id="hello" resname="hello">
+          <source>Hello, world!</source>
+          <target/>
+          <note>This is the message that the application displays to the user.</note>
+        </trans-unit>
+        <bin-unit id="logo" resname="logo" mime-type="image" restype="x-icu-binary" translate="no">
+          <!--The logo to be displayed in the application window.-->
+          <bin-source>
+            <external-file href="logo.gif"/>
+          </bin-source>
+        </bin-unit>
+        <bin-unit id="md5_sum" resname="md5_sum" mime-type="application" restype="x-icu-binary" translate="no">
+          <!--The MD5 checksum of the application.-->
+          <bin-source>
+            <internal-file form="application" crc="187654673">BCFE765BE0FDFAB22C5F9EFD12C52ABC</internal-file>
+          </bin-source>
+        </bin-unit>
+        <group id="menus" resname="menus" restype="x-icu-table">
+          <!-- The application menus. -->
+          <group id="menus_help_menu" resname="help_menu" restype="x-icu-table">
+            <trans-unit id="menus_help_menu_name" resname="name">
+              <source>Help</source>
+              <target/>
+            </trans-unit>
+            <group id="menus_help_menu_items" resname="items" restype="x-icu-array">
+              <trans-unit id="menus_help_menu_items_0">
+                <source>Help Topics</source>
+                <target/>
+              </trans-unit>
+              <trans-unit id="menus_help_menu_items_1">
+                <source>About Hello World</source>
+                <target/>
+              </trans-unit>
+            </group>
+          </group>
+        </group>
+      </group>
+    </body>
+  </file>
+</xliff>
+"""
+
+icu_docs_trimmed = """\
+<?xml version="1.0" encoding="utf-8"?>
+<xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 xliff-core-1.2-transitional.xsd">
+  <file original="en.txt" xml:space="preserve" source-language="en" datatype="x-icu-resource-bundle" date="2007-06-15T23:20:43Z">
+    <header>
+      <tool tool-id="genrb-3.3-icu-3.7.1" tool-name="genrb"/>
+    </header>
+    <body>
+      <group id="en" restype="x-icu-table">
+        <trans-unit id="authors" resname="authors" restype="x-icu-alias">
+          <source>root/authors</source>
+          <target/>
+        </trans-unit>
+        <trans-unit id="hello" resname="hello">
+          <source>Hello, world!</source>
+          <target/>
+        </trans-unit>
+        <bin-unit id="logo" resname="logo" mime-type="image" restype="x-icu-binary" translate="no">
+          <!--The logo to be displayed in the application window.-->
+          <bin-source>
+            <external-file href="logo.gif"/>
+          </bin-source>
+        </bin-unit>
+        <bin-unit id="md5_sum" resname="md5_sum" mime-type="application" restype="x-icu-binary" translate="no">
+          <!--The MD5 checksum of the application.-->
+          <bin-source>
+            <internal-file form="application" crc="187654673">BCFE765BE0FDFAB22C5F9EFD12C52ABC</internal-file>
+          </bin-source>
+        </bin-unit>
+        <group id="menus" resname="menus" restype="x-icu-table">
+          <group id="menus_help_menu" resname="help_menu" restype="x-icu-table">
+            <trans-unit id="menus_help_menu_name" resname="name">
+              <source>Help</source>
+              <target/>
+            </trans-unit>
+            <group id="menus_help_menu_items" resname="items" restype="x-icu-array">
+              <trans-unit id="menus_help_menu_items_0">
+                <source>Help Topics</source>
+                <target/>
+              </trans-unit>
+              <trans-unit id="menus_help_menu_items_1">
+                <source>About Hello World</source>
+                <target/>
+              </trans-unit>
+            </group>
+          </group>
+        </group>
+      </group>
+    </body>
+  </file>
+</xliff>
+"""
+
+xcode_serialized = """\
+<?xml version="1.0" encoding="utf-8"?>
+<xliff xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 http://docs.oasis-open.org/xliff/v1.2/os/xliff-core-1.2-strict.xsd">
+  <file original="xcode1/en.lproj/Localizable.strings" source-language="en" target-language="it" datatype="plaintext">
+    <header>
+      <tool tool-id="com.apple.dt.xcode" tool-name="Xcode" tool-version="15.2" build-num="15C500b"/>
+    </header>
+    <body>
+      <trans-unit id="[KeyFile/Delete/Confirm/text] Delete key file?&#10; Make sure you have a backup." xml:space="preserve">
+        <source>Delete key file?
+ Make sure you have a backup.</source>
+        <target state="translated">Eliminare il file chiave?
+Assicurati di avere una copia.</target>
+        <note>Message to confirm deletion of a key file.</note>
+      </trans-unit>
+    </body>
+  </file>
+  <file original="xcode1/en.lproj/Localizable.stringsdict" source-language="en" target-language="it" datatype="plaintext">
+    <header>
+      <tool tool-id="com.apple.dt.xcode" tool-name="Xcode" tool-version="15.2" build-num="15C500b"/>
+    </header>
+    <body>
+      <trans-unit id="/[Generic/Count/EntriesSelected]:dict/GenericCountEntriesSelected:dict/one:dict/:string">
+        <source>%d entry selected</source>
+        <target state="translated">%d voce selezionata</target>
+      </trans-unit>
+      <trans-unit id="/[Generic/Count/EntriesSelected]:dict/GenericCountEntriesSelected:dict/other:dict/:string">
+        <source>%d entries selected</source>
+        <target state="translated">%d voci selezionate</target>
+      </trans-unit>
+      <trans-unit id="/[Generic/Count/Threads]:dict/GenericCountThreads:dict/one:dict/:string">
+        <source>%d thread</source>
+        <target state="translated">%d thread</target>
+      </trans-unit>
+      <trans-unit id="/[Generic/Count/Threads]:dict/GenericCountThreads:dict/other:dict/:string">
+        <source>%d threads</source>
+        <target state="translated">%d thread</target>
+      </trans-unit>
+    </body>
+  </file>
+  <file original="xcode2/en.lproj/Localizable.stringsdict" source-language="en" target-language="en" datatype="plaintext">
+    <body>
+      <trans-unit id="/followed_by_three_and_others:dict/NSStringLocalizedFormatKey:dict/:string" xml:space="preserve">
+        <source>%#@OTHERS@</source>
+        <target>%#@OTHERS@</target>
+      </trans-unit>
+      <trans-unit id="/followed_by_three_and_others:dict/OTHERS:dict/one:dict/:string" xml:space="preserve">
+        <source>Followed by %2$@, %3$@, %4$@ &amp; %1$d other</source>
+        <target>Followed by %2$@, %3$@, %4$@ &amp; %1$d other</target>
+      </trans-unit>
+      <trans-unit id="/followed_by_three_and_others:dict/OTHERS:dict/other:dict/:string" xml:space="preserve">
+        <source>Followed by %2$@, %3$@, %4$@ &amp; %1$d others</source>
+        <target>Followed by %2$@, %3$@, %4$@ &amp; %1$d others</target>
+      </trans-unit>
+    </body>
+  </file>
+</xliff>
+"""
 
 
 class TestXliff1(TestCase):
     def test_parse_hello(self):
-        res = xliff_parse(hello)
+        res = parse_source(xliff_parse, "hello.xliff")
         assert res == Resource(
             Format.xliff,
             meta=[
@@ -75,29 +284,11 @@ class TestXliff1(TestCase):
         )
 
     def test_serialize_hello(self):
-        res = xliff_parse(hello)
-        ser = "".join(xliff_serialize(res))
-        assert ser == dedent(
-            """\
-            <?xml version="1.0" encoding="utf-8"?>
-            <xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">
-              <file original="hello.txt" source-language="en" target-language="fr" datatype="plaintext">
-                <body>
-                  <trans-unit id="hi">
-                    <source>Hello world</source>
-                    <target>Bonjour le monde</target>
-                    <alt-trans>
-                      <target xml:lang="es">Hola mundo</target>
-                    </alt-trans>
-                  </trans-unit>
-                </body>
-              </file>
-            </xliff>
-            """
-        )
+        res = parse_source(xliff_parse, "hello.xliff")
+        assert_serialized(xliff_serialize(res), hello_serialized)
 
     def test_parse_angular(self):
-        res = xliff_parse(angular)
+        res = parse_source(xliff_parse, "angular.xliff")
         assert res == Resource(
             Format.xliff,
             meta=[
@@ -175,41 +366,11 @@ class TestXliff1(TestCase):
         )
 
     def test_serialize_angular(self):
-        res = xliff_parse(angular)
-        ser = "".join(xliff_serialize(res))
-        assert ser == dedent(
-            """\
-            <?xml version="1.0" encoding="utf-8"?>
-            <xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2">
-              <file original="ng2.template" source-language="en" target-language="fi" datatype="plaintext">
-                <body>
-                  <trans-unit id="introductionHeader" datatype="html">
-                    <source>
-              Hello i18n!
-            </source>
-                    <target>
-              Hei i18n!
-            </target>
-                    <context-group purpose="location">
-                      <context context-type="sourcefile">app/app.component.ts</context>
-                      <context context-type="linenumber">3</context>
-                    </context-group>
-                    <note priority="1" from="description">An introduction header for this sample</note>
-                    <note priority="1" from="meaning">User welcome</note>
-                  </trans-unit>
-                  <trans-unit id="icu_plural" datatype="html">
-                    <source>{VAR_PLURAL, plural, =0 {just now} =1 {one minute ago} other {<x id="INTERPOLATION" equiv-text="{{minutes}}"/> minutes ago} }</source>
-                    <target>{VAR_PLURAL, plural, =0 {juuri nyt} =1 {minuutti sitten} other {<x id="INTERPOLATION" equiv-text="{{minutes}}"/> minuuttia sitten} }</target>
-                    <note></note>
-                  </trans-unit>
-                </body>
-              </file>
-            </xliff>
-            """
-        )
+        res = parse_source(xliff_parse, "angular.xliff")
+        assert_serialized(xliff_serialize(res), angular_serialized)
 
     def test_parse_icu_docs(self):
-        res = xliff_parse(icu_docs)
+        res = parse_source(xliff_parse, "icu-docs.xliff")
         assert res == Resource(
             Format.xliff,
             meta=[
@@ -357,126 +518,15 @@ class TestXliff1(TestCase):
         )
 
     def test_serialize_icu_docs(self):
-        res = xliff_parse(icu_docs)
-        ser = "".join(xliff_serialize(res))
-        assert ser == dedent(
-            """\
-            <?xml version="1.0" encoding="utf-8"?>
-            <xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 xliff-core-1.2-transitional.xsd">
-              <file original="en.txt" xml:space="preserve" source-language="en" datatype="x-icu-resource-bundle" date="2007-06-15T23:20:43Z">
-                <header>
-                  <tool tool-id="genrb-3.3-icu-3.7.1" tool-name="genrb"/>
-                </header>
-                <body>
-                  <group id="en" restype="x-icu-table">
-                    <!-- The resources for a fictious Hello World application. The application displays a single window with a logo and the hello message. -->
-                    <trans-unit id="authors" resname="authors" restype="x-icu-alias">
-                      <source>root/authors</source>
-                      <target/>
-                    </trans-unit>
-                    <trans-unit id="hello" resname="hello">
-                      <source>Hello, world!</source>
-                      <target/>
-                      <note>This is the message that the application displays to the user.</note>
-                    </trans-unit>
-                    <bin-unit id="logo" resname="logo" mime-type="image" restype="x-icu-binary" translate="no">
-                      <!--The logo to be displayed in the application window.-->
-                      <bin-source>
-                        <external-file href="logo.gif"/>
-                      </bin-source>
-                    </bin-unit>
-                    <bin-unit id="md5_sum" resname="md5_sum" mime-type="application" restype="x-icu-binary" translate="no">
-                      <!--The MD5 checksum of the application.-->
-                      <bin-source>
-                        <internal-file form="application" crc="187654673">BCFE765BE0FDFAB22C5F9EFD12C52ABC</internal-file>
-                      </bin-source>
-                    </bin-unit>
-                    <group id="menus" resname="menus" restype="x-icu-table">
-                      <!-- The application menus. -->
-                      <group id="menus_help_menu" resname="help_menu" restype="x-icu-table">
-                        <trans-unit id="menus_help_menu_name" resname="name">
-                          <source>Help</source>
-                          <target/>
-                        </trans-unit>
-                        <group id="menus_help_menu_items" resname="items" restype="x-icu-array">
-                          <trans-unit id="menus_help_menu_items_0">
-                            <source>Help Topics</source>
-                            <target/>
-                          </trans-unit>
-                          <trans-unit id="menus_help_menu_items_1">
-                            <source>About Hello World</source>
-                            <target/>
-                          </trans-unit>
-                        </group>
-                      </group>
-                    </group>
-                  </group>
-                </body>
-              </file>
-            </xliff>
-            """
-        )
+        res = parse_source(xliff_parse, "icu-docs.xliff")
+        assert_serialized(xliff_serialize(res), icu_docs_serialized)
 
     def test_trim_comments(self):
-        res = xliff_parse(icu_docs)
-        ser = "".join(xliff_serialize(res, trim_comments=True))
-        assert ser == dedent(
-            """\
-            <?xml version="1.0" encoding="utf-8"?>
-            <xliff xmlns="urn:oasis:names:tc:xliff:document:1.2" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 xliff-core-1.2-transitional.xsd">
-              <file original="en.txt" xml:space="preserve" source-language="en" datatype="x-icu-resource-bundle" date="2007-06-15T23:20:43Z">
-                <header>
-                  <tool tool-id="genrb-3.3-icu-3.7.1" tool-name="genrb"/>
-                </header>
-                <body>
-                  <group id="en" restype="x-icu-table">
-                    <trans-unit id="authors" resname="authors" restype="x-icu-alias">
-                      <source>root/authors</source>
-                      <target/>
-                    </trans-unit>
-                    <trans-unit id="hello" resname="hello">
-                      <source>Hello, world!</source>
-                      <target/>
-                    </trans-unit>
-                    <bin-unit id="logo" resname="logo" mime-type="image" restype="x-icu-binary" translate="no">
-                      <!--The logo to be displayed in the application window.-->
-                      <bin-source>
-                        <external-file href="logo.gif"/>
-                      </bin-source>
-                    </bin-unit>
-                    <bin-unit id="md5_sum" resname="md5_sum" mime-type="application" restype="x-icu-binary" translate="no">
-                      <!--The MD5 checksum of the application.-->
-                      <bin-source>
-                        <internal-file form="application" crc="187654673">BCFE765BE0FDFAB22C5F9EFD12C52ABC</internal-file>
-                      </bin-source>
-                    </bin-unit>
-                    <group id="menus" resname="menus" restype="x-icu-table">
-                      <group id="menus_help_menu" resname="help_menu" restype="x-icu-table">
-                        <trans-unit id="menus_help_menu_name" resname="name">
-                          <source>Help</source>
-                          <target/>
-                        </trans-unit>
-                        <group id="menus_help_menu_items" resname="items" restype="x-icu-array">
-                          <trans-unit id="menus_help_menu_items_0">
-                            <source>Help Topics</source>
-                            <target/>
-                          </trans-unit>
-                          <trans-unit id="menus_help_menu_items_1">
-                            <source>About Hello World</source>
-                            <target/>
-                          </trans-unit>
-                        </group>
-                      </group>
-                    </group>
-                  </group>
-                </body>
-              </file>
-            </xliff>
-            """
-        )
+        res = parse_source(xliff_parse, "icu-docs.xliff")
+        assert_serialized(xliff_serialize(res, trim_comments=True), icu_docs_trimmed)
 
     def test_parse_xcode(self):
-        res = xliff_parse(xcode)
+        res = parse_source(xliff_parse, "xcode.xliff")
         assert res == Resource(
             Format.xliff,
             meta=[
@@ -697,65 +747,5 @@ class TestXliff1(TestCase):
         )
 
     def test_serialize_xcode(self):
-        res = xliff_parse(xcode)
-        ser = "".join(xliff_serialize(res))
-        assert ser == dedent(
-            """\
-            <?xml version="1.0" encoding="utf-8"?>
-            <xliff xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="urn:oasis:names:tc:xliff:document:1.2" version="1.2" xsi:schemaLocation="urn:oasis:names:tc:xliff:document:1.2 http://docs.oasis-open.org/xliff/v1.2/os/xliff-core-1.2-strict.xsd">
-              <file original="xcode1/en.lproj/Localizable.strings" source-language="en" target-language="it" datatype="plaintext">
-                <header>
-                  <tool tool-id="com.apple.dt.xcode" tool-name="Xcode" tool-version="15.2" build-num="15C500b"/>
-                </header>
-                <body>
-                  <trans-unit id="[KeyFile/Delete/Confirm/text] Delete key file?&#10; Make sure you have a backup." xml:space="preserve">
-                    <source>Delete key file?
-             Make sure you have a backup.</source>
-                    <target state="translated">Eliminare il file chiave?
-            Assicurati di avere una copia.</target>
-                    <note>Message to confirm deletion of a key file.</note>
-                  </trans-unit>
-                </body>
-              </file>
-              <file original="xcode1/en.lproj/Localizable.stringsdict" source-language="en" target-language="it" datatype="plaintext">
-                <header>
-                  <tool tool-id="com.apple.dt.xcode" tool-name="Xcode" tool-version="15.2" build-num="15C500b"/>
-                </header>
-                <body>
-                  <trans-unit id="/[Generic/Count/EntriesSelected]:dict/GenericCountEntriesSelected:dict/one:dict/:string">
-                    <source>%d entry selected</source>
-                    <target state="translated">%d voce selezionata</target>
-                  </trans-unit>
-                  <trans-unit id="/[Generic/Count/EntriesSelected]:dict/GenericCountEntriesSelected:dict/other:dict/:string">
-                    <source>%d entries selected</source>
-                    <target state="translated">%d voci selezionate</target>
-                  </trans-unit>
-                  <trans-unit id="/[Generic/Count/Threads]:dict/GenericCountThreads:dict/one:dict/:string">
-                    <source>%d thread</source>
-                    <target state="translated">%d thread</target>
-                  </trans-unit>
-                  <trans-unit id="/[Generic/Count/Threads]:dict/GenericCountThreads:dict/other:dict/:string">
-                    <source>%d threads</source>
-                    <target state="translated">%d thread</target>
-                  </trans-unit>
-                </body>
-              </file>
-              <file original="xcode2/en.lproj/Localizable.stringsdict" source-language="en" target-language="en" datatype="plaintext">
-                <body>
-                  <trans-unit id="/followed_by_three_and_others:dict/NSStringLocalizedFormatKey:dict/:string" xml:space="preserve">
-                    <source>%#@OTHERS@</source>
-                    <target>%#@OTHERS@</target>
-                  </trans-unit>
-                  <trans-unit id="/followed_by_three_and_others:dict/OTHERS:dict/one:dict/:string" xml:space="preserve">
-                    <source>Followed by %2$@, %3$@, %4$@ &amp; %1$d other</source>
-                    <target>Followed by %2$@, %3$@, %4$@ &amp; %1$d other</target>
-                  </trans-unit>
-                  <trans-unit id="/followed_by_three_and_others:dict/OTHERS:dict/other:dict/:string" xml:space="preserve">
-                    <source>Followed by %2$@, %3$@, %4$@ &amp; %1$d others</source>
-                    <target>Followed by %2$@, %3$@, %4$@ &amp; %1$d others</target>
-                  </trans-unit>
-                </body>
-              </file>
-            </xliff>
-            """
-        )
+        res = parse_source(xliff_parse, "xcode.xliff")
+        assert_serialized(xliff_serialize(res), xcode_serialized)
@@ -14,165 +14,224 @@
 
 from __future__ import annotations
 
-import sys
-from os import mkdir
 from os.path import join, normpath
-from tempfile import TemporaryDirectory
-from textwrap import dedent
-from typing import Any, Dict, Union
-from unittest import TestCase
+from typing import Any
 
+from moz.l10n._toml import load
 from moz.l10n.paths import L10nConfigPaths, get_android_locale
 
-if sys.version_info >= (3, 11):
-    from tomllib import load
-else:
-    from tomli import load
+from . import FileTreeTestCase, Tree, build_file_tree
 
-Tree = Dict[str, Union[str, "Tree"]]
+paths_toml = """
+[[paths]]
+    reference = "en/one.pot"
+    l10n = "{locale}/one.po"
+[[paths]]
+    reference = "en/two/**"
+    l10n = "{locale}/x/two/**"
+[[paths]]
+    reference = "en/three/**/*.ftl"
+    l10n = "{locale}/y/**/*.ftl"
+"""
 
+paths_expected = tuple(
+    (normpath(ref), normpath(tgt))
+    for ref, tgt in (
+        ("one.pot", "one.po"),
+        ("three/c.ftl", "y/c.ftl"),
+        ("three/d/e.ftl", "y/d/e.ftl"),
+        ("three/extra.ftl", "y/extra.ftl"),
+        ("two/a", "x/two/a"),
+        ("two/b.pot", "x/two/b.po"),
+    )
+)
 
-def build_file_tree(root: str, tree: Tree) -> None:
-    for name, value in tree.items():
-        path = join(root, name)
-        if isinstance(value, str):
-            with open(path, "x") as file:
-                if value:
-                    file.write(value)
-        else:
-            mkdir(path)
-            build_file_tree(path, value)
+firefox_browser_toml = """
+basepath = "../.."
+[env]
+    l = "{l10n_base}/{locale}/"
+[[paths]]
+    reference = "browser/locales/en-US/**"
+    l10n = "{l}browser/**"
+[[paths]]
+    reference = "browser/branding/locales/en-US/**"
+    l10n = "{l}browser/branding/**"
+[[includes]]
+    path = "devtools/shared/locales/l10n.toml"
+[[includes]]
+    path = "toolkit/locales/l10n.toml"
+"""
 
+firefox_devtools_toml = """
+# included in both browser_toml and toolkit_toml
+basepath = "../../.."
+[[paths]]
+    reference = "devtools/shared/locales/en-US/**"
+    l10n = "{l10n_base}/{locale}/devtools/**"
+[[includes]]
+    # reference loop
+    path = "toolkit/locales/l10n.toml"
+"""
 
-class TestL10nConfigPaths(TestCase):
+firefox_toolkit_toml = """
+basepath = "../.."
+[env]
+    l = "{l10n_base}/{locale}/"
+[[paths]]
+    reference = "toolkit/locales/en-US/**"
+    l10n = "{l}toolkit/**"
+[[paths]]
+    reference = "dom/locales/en-US/**"
+    l10n = "{l}dom/**"
+[[paths]]
+    # duplicates path included in browser_toml
+    reference = "browser/locales/en-US/b/**"
+    l10n = "{l}browser/b/**"
+[[includes]]
+    path = "devtools/shared/locales/l10n.toml"
+"""
+
+firefox_expected = tuple(
+    (normpath(ref), normpath(tgt))
+    for ref, tgt in (
+        ("browser/branding/locales/en-US/a", "browser/branding/a"),
+        ("browser/branding/locales/en-US/b/c", "browser/branding/b/c"),
+        ("browser/locales/en-US/a", "browser/a"),
+        ("browser/locales/en-US/b/c", "browser/b/c"),
+        ("devtools/shared/locales/en-US/a", "devtools/a"),
+        ("devtools/shared/locales/en-US/b/c", "devtools/b/c"),
+        ("dom/locales/en-US/a", "dom/a"),
+        ("dom/locales/en-US/b/c", "dom/b/c"),
+        ("toolkit/locales/en-US/a", "toolkit/a"),
+        ("toolkit/locales/en-US/b/c", "toolkit/b/c"),
+    )
+)
+
+fomo_toml = """
+basepath = "foundation/translations/networkapi"
+locales = ["de", "es", "fr", "fy-NL", "nl", "pl", "pt-BR", "sw"]
+[[paths]]
+    reference = "wagtailpages/templates/buyersguide/locale/django.pot"
+    l10n = "wagtailpages/templates/buyersguide/locale/{locale}/LC_MESSAGES/django.po"
+[[paths]]
+    reference = "wagtailpages/templates/about/locale/django.pot"
+    l10n = "wagtailpages/templates/about/locale/{locale}/LC_MESSAGES/django.po"
+    locales = ["de", "es", "fr", "pt-BR"]
+[[paths]]
+    reference = "templates/pages/buyersguide/about/locale/django.pot"
+    l10n = "templates/pages/buyersguide/about/locale/{locale}/LC_MESSAGES/django.po"
+    locales = ["de", "es", "fr", "pt-BR"]
+"""
+
+fenix_toml = """
+locales = ["abc", "de-FG"]
+[[paths]]
+    reference = "res/values/strings.xml"
+    l10n = "res/values-{android_locale}/strings.xml"
+"""
+
+fxa_root_toml = """
+basepath = "."
+[[includes]]
+    path = "mozilla-mobile/android-components/l10n.toml"
+"""
+
+fxa_ac_toml = """
+basepath = "."
+[[paths]]
+    reference = "components/**/src/main/res/values/strings.xml"
+    l10n = "components/**/src/main/res/values-{android_locale}/strings.xml"
+"""
+
+tb_mail_toml = """
+basepath = "../.."
+[env]
+    l = "{l10n_base}/{locale}/"
+    mozilla = ".."
+[[includes]]
+    path = "{mozilla}/toolkit/locales/l10n.toml"
+[[includes]]
+    path = "calendar/locales/l10n.toml"
+[[paths]]
+    reference = "mail/locales/en-US/**"
+    l10n = "{l}mail/**"
+"""
+
+tb_calendar_toml = """
+basepath = "../.."
+[env]
+    l = "{l10n_base}/{locale}/"
+[[paths]]
+    reference = "calendar/locales/en-US/**"
+    l10n = "{l}calendar/**"
+"""
+
+tb_toolkit_toml = """
+basepath = "../.."
+[env]
+    l = "{l10n_base}/{locale}/"
+[[paths]]
+    reference = "toolkit/locales/en-US/**"
+    l10n = "{l}toolkit/**"
+"""
+
+
+class TestL10nConfigPaths(FileTreeTestCase):
     def test_paths(self):
-        cfg_toml = dedent(
-            """
-            [[paths]]
-                reference = "en/one.pot"
-                l10n = "{locale}/one.po"
-            [[paths]]
-                reference = "en/two/**"
-                l10n = "{locale}/x/two/**"
-            [[paths]]
-                reference = "en/three/**/*.ftl"
-                l10n = "{locale}/y/**/*.ftl"
-            """
-        )
         tree: Tree = {
-            "cfg": cfg_toml,
+            "cfg": paths_toml,
             "en": {
                 "one.pot": "",
                 "two": {"a": "", "b.pot": ""},
                 "three": {"c.ftl": "", "d": {"e.ftl": ""}, "f.ftl": {"g": ""}},
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nConfigPaths(
-                join(root, "cfg"), force_paths=[join(root, "en", "three", "extra.ftl")]
-            )
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nConfigPaths(
+            join(root, "cfg"), force_paths=[join(root, "en", "three", "extra.ftl")]
+        )
 
         assert paths.base == root
         assert paths.locales is None
         expected = {
-            (
-                join(root, "en", normpath(ref)),
-                join(root, "{locale}", normpath(tgt)),
-            ): None
-            for ref, tgt in {
-                "one.pot": "one.po",
-                "three/c.ftl": "y/c.ftl",
-                "three/d/e.ftl": "y/d/e.ftl",
-                "three/extra.ftl": "y/extra.ftl",
-                "two/a": "x/two/a",
-                "two/b.pot": "x/two/b.po",
-            }.items()
+            (join(root, "en", ref), join(root, "{locale}", tgt)): None
+            for ref, tgt in paths_expected
         }
         assert paths.all() == expected
         for ref, tgt in expected:
             assert paths.target(ref) == (tgt, ())
-        assert paths.find_reference("xx/one.po") == (
-            join(root, "en", "one.pot"),
-            {"locale": "xx"},
-        )
-        assert paths.find_reference("yy-YY/x/two/b.po") == (
-            join(root, "en", "two", "b.pot"),
-            {"locale": "yy-YY"},
-        )
-        assert paths.find_reference("xx-Latn-XX/y/d/e.ftl") == (
-            join(root, "en", "three", "d", "e.ftl"),
-            {"locale": "xx-Latn-XX"},
-        )
-        assert paths.find_reference("xx-Latn/y/extra.ftl") == (
-            join(root, "en", "three", "extra.ftl"),
-            {"locale": "xx-Latn"},
-        )
-        assert paths.find_reference("xx//") is None
-        assert paths.find_reference("xx/x/two") is None
-        assert paths.find_reference("xx/y/x/w.ftl") is None
+        en = join(root, "en")
+        for target, exp in (
+            ("xx/one.po", (join(en, "one.pot"), {"locale": "xx"})),
+            ("yy-YY/x/two/b.po", (join(en, "two", "b.pot"), {"locale": "yy-YY"})),
+            (
+                "xx-Latn-XX/y/d/e.ftl",
+                (join(en, "three", "d", "e.ftl"), {"locale": "xx-Latn-XX"}),
+            ),
+            (
+                "xx-Latn/y/extra.ftl",
+                (join(en, "three", "extra.ftl"), {"locale": "xx-Latn"}),
+            ),
+            ("xx//", None),
+            ("xx/x/two", None),
+            ("xx/y/x/w.ftl", None),
+        ):
+            assert paths.find_reference(target) == exp
 
     def test_firefox(self):
-        browser_toml = dedent(
-            """
-            basepath = "../.."
-            [env]
-                l = "{l10n_base}/{locale}/"
-            [[paths]]
-                reference = "browser/locales/en-US/**"
-                l10n = "{l}browser/**"
-            [[paths]]
-                reference = "browser/branding/locales/en-US/**"
-                l10n = "{l}browser/branding/**"
-            [[includes]]
-                path = "devtools/shared/locales/l10n.toml"
-            [[includes]]
-                path = "toolkit/locales/l10n.toml"
-            """
-        )
-        devtools_toml = dedent(
-            """
-            # included in both browser_toml and toolkit_toml
-            basepath = "../../.."
-            [[paths]]
-                reference = "devtools/shared/locales/en-US/**"
-                l10n = "{l10n_base}/{locale}/devtools/**"
-            [[includes]]
-                # reference loop
-                path = "toolkit/locales/l10n.toml"
-            """
-        )
-        toolkit_toml = dedent(
-            """
-            basepath = "../.."
-            [env]
-                l = "{l10n_base}/{locale}/"
-            [[paths]]
-                reference = "toolkit/locales/en-US/**"
-                l10n = "{l}toolkit/**"
-            [[paths]]
-                reference = "dom/locales/en-US/**"
-                l10n = "{l}dom/**"
-            [[paths]]
-                # duplicates path included in browser_toml
-                reference = "browser/locales/en-US/b/**"
-                l10n = "{l}browser/b/**"
-            [[includes]]
-                path = "devtools/shared/locales/l10n.toml"
-            """
-        )
         tree: Tree = {
             "browser": {
                 "branding": {"locales": {"en-US": {"a": "", "b": {"c": ""}}}},
                 "locales": {
-                    "l10n.toml": browser_toml,
+                    "l10n.toml": firefox_browser_toml,
                     "en-US": {"a": "", "b": {"c": ""}},
                 },
             },
             "devtools": {
                 "shared": {
                     "locales": {
-                        "l10n.toml": devtools_toml,
+                        "l10n.toml": firefox_devtools_toml,
                         "en-US": {"a": "", "b": {"c": ""}},
                     }
                 }
@@ -185,7 +244,7 @@ class TestL10nConfigPaths(TestCase):
             },
             "toolkit": {
                 "locales": {
-                    "l10n.toml": toolkit_toml,
+                    "l10n.toml": firefox_toolkit_toml,
                     "en-US": {"a": "", "b": {"c": ""}},
                 }
             },
@@ -197,11 +256,11 @@ class TestL10nConfigPaths(TestCase):
             with open(cfg_path, mode="rb") as file:
                 return load(file)
 
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nConfigPaths(
-                join(root, "browser", "locales", "l10n.toml"), cfg_load=cfg_load
-            )
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nConfigPaths(
+            join(root, "browser", "locales", "l10n.toml"), cfg_load=cfg_load
+        )
 
         assert loaded == [
             join(root, p, "locales", "l10n.toml")
@@ -210,19 +269,8 @@ class TestL10nConfigPaths(TestCase):
         assert paths.base == root
         assert paths.locales is None
         expected = {
-            (join(root, normpath(ref)), join(root, "{locale}", normpath(tgt))): None
-            for ref, tgt in {
-                "browser/branding/locales/en-US/a": "browser/branding/a",
-                "browser/branding/locales/en-US/b/c": "browser/branding/b/c",
-                "browser/locales/en-US/a": "browser/a",
-                "browser/locales/en-US/b/c": "browser/b/c",
-                "devtools/shared/locales/en-US/a": "devtools/a",
-                "devtools/shared/locales/en-US/b/c": "devtools/b/c",
-                "dom/locales/en-US/a": "dom/a",
-                "dom/locales/en-US/b/c": "dom/b/c",
-                "toolkit/locales/en-US/a": "toolkit/a",
-                "toolkit/locales/en-US/b/c": "toolkit/b/c",
-            }.items()
+            (join(root, ref), join(root, "{locale}", tgt)): None
+            for ref, tgt in firefox_expected
         }
         assert paths.all() == expected
         for ref, tgt in expected:
@@ -240,26 +288,9 @@ class TestL10nConfigPaths(TestCase):
         )
 
     def test_fomo_buyersguide(self):
-        cfg_toml = dedent(
-            """
-            basepath = "foundation/translations/networkapi"
-            locales = ["de", "es", "fr", "fy-NL", "nl", "pl", "pt-BR", "sw"]
-            [[paths]]
-                reference = "wagtailpages/templates/buyersguide/locale/django.pot"
-                l10n = "wagtailpages/templates/buyersguide/locale/{locale}/LC_MESSAGES/django.po"
-            [[paths]]
-                reference = "wagtailpages/templates/about/locale/django.pot"
-                l10n = "wagtailpages/templates/about/locale/{locale}/LC_MESSAGES/django.po"
-                locales = ["de", "es", "fr", "pt-BR"]
-            [[paths]]
-                reference = "templates/pages/buyersguide/about/locale/django.pot"
-                l10n = "templates/pages/buyersguide/about/locale/{locale}/LC_MESSAGES/django.po"
-                locales = ["de", "es", "fr", "pt-BR"]
-            """
-        )
-        with TemporaryDirectory() as root:
-            build_file_tree(root, {"l10n.toml": cfg_toml})
-            paths = L10nConfigPaths(join(root, "l10n.toml"))
+        root = self.root
+        build_file_tree(root, {"l10n.toml": fomo_toml})
+        paths = L10nConfigPaths(join(root, "l10n.toml"))
         assert paths.base == join(root, "foundation", "translations", "networkapi")
         assert paths.locales == ["de", "es", "fr", "fy-NL", "nl", "pl", "pt-BR", "sw"]
         path_locales = ["de", "es", "fr", "pt-BR"]
@@ -294,28 +325,20 @@ class TestL10nConfigPaths(TestCase):
         assert paths.target(res_source)[1] == path_locales
 
     def test_fenix(self):
-        cfg_toml = dedent(
-            """
-            locales = ["abc", "de-FG"]
-            [[paths]]
-                reference = "res/values/strings.xml"
-                l10n = "res/values-{android_locale}/strings.xml"
-            """
-        )
         tree: Tree = {
-            "l10n.toml": cfg_toml,
+            "l10n.toml": fenix_toml,
             "res": {
                 "values": {"strings.xml": ""},
                 "values-b+abc": {"strings.xml": ""},
                 "values-b+de+FG": {"strings.xml": ""},
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nConfigPaths(
-                join(root, "l10n.toml"),
-                locale_map={"android_locale": lambda lc: f"b+{lc.replace('-', '+')}"},
-            )
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nConfigPaths(
+            join(root, "l10n.toml"),
+            locale_map={"android_locale": lambda lc: f"b+{lc.replace('-', '+')}"},
+        )
 
         assert paths.base == paths.ref_root == root
         source_strings = join(root, "res", "values", "strings.xml")
@@ -339,26 +362,11 @@ class TestL10nConfigPaths(TestCase):
         assert paths.find_reference("res/values-xx/nonesuch") is None
 
     def test_firefox_for_android(self):
-        root_toml = dedent(
-            """
-            basepath = "."
-            [[includes]]
-                path = "mozilla-mobile/android-components/l10n.toml"
-            """
-        )
-        ac_toml = dedent(
-            """
-            basepath = "."
-            [[paths]]
-                reference = "components/**/src/main/res/values/strings.xml"
-                l10n = "components/**/src/main/res/values-{android_locale}/strings.xml"
-            """
-        )
         tree: Tree = {
-            "l10n.toml": root_toml,
+            "l10n.toml": fxa_root_toml,
             "mozilla-mobile": {
                 "android-components": {
-                    "l10n.toml": ac_toml,
+                    "l10n.toml": fxa_ac_toml,
                     "components": {
                         "foo": {
                             "src": {
@@ -374,12 +382,12 @@ class TestL10nConfigPaths(TestCase):
                 },
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nConfigPaths(
-                join(root, "l10n.toml"),
-                locale_map={"android_locale": get_android_locale},
-            )
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nConfigPaths(
+            join(root, "l10n.toml"),
+            locale_map={"android_locale": get_android_locale},
+        )
 
         assert paths.base == root
         assert paths.locales is None
@@ -407,66 +415,31 @@ class TestL10nConfigPaths(TestCase):
         )
 
     def test_thunderbird(self):
-        mail_toml = dedent(
-            """
-            basepath = "../.."
-            [env]
-                l = "{l10n_base}/{locale}/"
-                mozilla = ".."
-            [[includes]]
-                path = "{mozilla}/toolkit/locales/l10n.toml"
-            [[includes]]
-                path = "calendar/locales/l10n.toml"
-            [[paths]]
-                reference = "mail/locales/en-US/**"
-                l10n = "{l}mail/**"
-            """
-        )
-        calendar_toml = dedent(
-            """
-            basepath = "../.."
-            [env]
-                l = "{l10n_base}/{locale}/"
-            [[paths]]
-                reference = "calendar/locales/en-US/**"
-                l10n = "{l}calendar/**"
-            """
-        )
-        toolkit_toml = dedent(
-            """
-            basepath = "../.."
-            [env]
-                l = "{l10n_base}/{locale}/"
-            [[paths]]
-                reference = "toolkit/locales/en-US/**"
-                l10n = "{l}toolkit/**"
-            """
-        )
         tree: Tree = {
             "comm": {
                 "calendar": {
                     "locales": {
-                        "l10n.toml": calendar_toml,
+                        "l10n.toml": tb_calendar_toml,
                         "en-US": {"calendar": {"calendar.ftl": ""}},
                     }
                 },
                 "mail": {
                     "locales": {
-                        "l10n.toml": mail_toml,
+                        "l10n.toml": tb_mail_toml,
                         "en-US": {"installer": {"override.properties": ""}},
                     }
                 },
             },
             "toolkit": {
                 "locales": {
-                    "l10n.toml": toolkit_toml,
+                    "l10n.toml": tb_toolkit_toml,
                     "en-US": {"toolkit": {"about": {"config.ftl": ""}}},
                 }
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nConfigPaths(join(root, "comm", "mail", "locales", "l10n.toml"))
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nConfigPaths(join(root, "comm", "mail", "locales", "l10n.toml"))
 
         override = join("installer", "override.properties")
         config = join("toolkit", "about", "config.ftl")
@@ -14,44 +14,40 @@
 
 from __future__ import annotations
 
-from os import mkdir
 from os.path import join, normpath
-from tempfile import TemporaryDirectory
-from typing import Dict, Union
-from unittest import TestCase
 
 from moz.l10n.paths import L10nDiscoverPaths, MissingSourceDirectoryError
 
-Tree = Dict[str, Union[str, "Tree"]]
+from . import FileTreeTestCase, Tree, build_file_tree
 
+discover_expected = tuple(
+    (normpath(ref), normpath(tgt))
+    for ref, tgt in (
+        ("one.pot", "one.po"),
+        ("three/c", "three/c"),
+        ("three/d/e", "three/d/e"),
+        ("three/f/g.ftl", "three/f/g.ftl"),
+        ("two/a.ftl", "two/a.ftl"),
+        ("two/b.pot", "two/b.po"),
+    )
+)
 
-def build_file_tree(root: str, tree: Tree) -> None:
-    for name, value in tree.items():
-        path = join(root, name)
-        if isinstance(value, str):
-            with open(path, "x") as file:
-                if value:
-                    file.write(value)
-        else:
-            mkdir(path)
-            build_file_tree(path, value)
 
-
-class TestL10nDiscover(TestCase):
+class TestL10nDiscover(FileTreeTestCase):
     def test_not_found(self):
         tree: Tree = {
             "one.pot": "",
             "two": {"a.ftl": "", "b.pot": ""},
             "three": {"c": "", "d": {"e": ""}, "f": {"g.ftl": ""}},
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            with self.assertRaises(MissingSourceDirectoryError):
-                L10nDiscoverPaths(root)
-            paths = L10nDiscoverPaths(
-                root, ref_root=root, force_paths=[join(root, "extra.ftl")]
-            )
-            paths.base = join(root, "base")
+        root = self.root
+        build_file_tree(root, tree)
+        with self.assertRaises(MissingSourceDirectoryError):
+            L10nDiscoverPaths(root)
+        paths = L10nDiscoverPaths(
+            root, ref_root=root, force_paths=[join(root, "extra.ftl")]
+        )
+        paths.base = join(root, "base")
         assert paths.ref_root == root
         assert paths.target("nonesuch.ftl") == (None, ())
         assert paths.target("extra.ftl") == (
@@ -67,9 +63,9 @@ class TestL10nDiscover(TestCase):
                 "three": {"c": "", "d": {"e": ""}, "f": {"g.ftl": ""}},
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nDiscoverPaths(root)
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nDiscoverPaths(root)
 
         assert paths.ref_root == join(root, "en")
         assert paths.base is None
@@ -84,35 +80,28 @@ class TestL10nDiscover(TestCase):
         paths.base = join(root, "target")
         expected = {
             (
-                join(root, "en", normpath(ref)),
-                join(root, "target", "{locale}", normpath(tgt)),
+                join(root, "en", ref),
+                join(root, "target", "{locale}", tgt),
             ): None
-            for ref, tgt in {
-                "one.pot": "one.po",
-                "three/c": "three/c",
-                "three/d/e": "three/d/e",
-                "three/f/g.ftl": "three/f/g.ftl",
-                "two/a.ftl": "two/a.ftl",
-                "two/b.pot": "two/b.po",
-            }.items()
+            for ref, tgt in discover_expected
         }
         assert paths.all() == expected
         for ref, tgt in expected:
             assert paths.target(ref) == (tgt, ())
 
     def test_ref_priorities(self):
-        with TemporaryDirectory() as root:
-            build_file_tree(root, {"en_US": {"a.ftl": ""}})
-            assert L10nDiscoverPaths(root).ref_root == join(root, "en_US")
+        root = self.root
+        build_file_tree(root, {"en_US": {"a.ftl": ""}})
+        assert L10nDiscoverPaths(root).ref_root == join(root, "en_US")
 
-            build_file_tree(root, {"en": {"a.json": ""}})
-            assert L10nDiscoverPaths(root).ref_root == join(root, "en_US")
+        build_file_tree(root, {"en": {"a.json": ""}})
+        assert L10nDiscoverPaths(root).ref_root == join(root, "en_US")
 
-            build_file_tree(join(root, "en"), {"a.pot": ""})
-            assert L10nDiscoverPaths(root).ref_root == join(root, "en")
+        build_file_tree(join(root, "en"), {"a.pot": ""})
+        assert L10nDiscoverPaths(root).ref_root == join(root, "en")
 
-            build_file_tree(root, {"foo": {"en-US": {"bar": {"a.pot": ""}}}})
-            assert L10nDiscoverPaths(root).ref_root == join(root, "foo", "en-US")
+        build_file_tree(root, {"foo": {"en-US": {"bar": {"a.pot": ""}}}})
+        assert L10nDiscoverPaths(root).ref_root == join(root, "foo", "en-US")
 
     def test_locales(self):
         tree: Tree = {
@@ -127,51 +116,51 @@ class TestL10nDiscover(TestCase):
                 "yy_Latn": {"a.ftl": "", "b.ftl": ""},
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-            paths = L10nDiscoverPaths(root)
-
-            assert paths.ref_root == join(root, "source", "en")
-            assert paths.base == join(root, "target")
-            assert paths.locales == ["yy-Latn", "zz"]
-            assert paths.all() == {
-                (
-                    join(paths.ref_root, "a.ftl"),
-                    join(paths.base, "{locale}", "a.ftl"),
-                ): paths.locales,
-                (
-                    join(paths.ref_root, "b.ftl"),
-                    join(paths.base, "{locale}", "b.ftl"),
-                ): paths.locales,
-                (
-                    join(paths.ref_root, "c.pot"),
-                    join(paths.base, "{locale}", "c.po"),
-                ): paths.locales,
-            }
-            assert paths.target(join(paths.ref_root, "c.pot")) == paths.target("c.pot")
-            assert paths.target("a.ftl") == (
-                join(paths.base, "{locale}", "a.ftl"),
-                paths.locales,
-            )
-            assert paths.target("c.pot") == (
-                join(paths.base, "{locale}", "c.po"),
-                paths.locales,
-            )
-            assert paths.target(join(root, "source", "en-US", "a.ftl")) == (None, ())
-            # This relies on the `yy_Latn` directory being actually present.
-            assert paths.format_target_path("{locale}/c.pot", "yy-Latn") == join(
-                paths.base, "yy_Latn", "c.pot"
-            )
-            assert paths.find_reference(join(root, "target", "zz", "a.ftl")) == (
+        root = self.root
+        build_file_tree(root, tree)
+        paths = L10nDiscoverPaths(root)
+
+        assert paths.ref_root == join(root, "source", "en")
+        assert paths.base == join(root, "target")
+        assert paths.locales == ["yy-Latn", "zz"]
+        assert paths.all() == {
+            (
                 join(paths.ref_root, "a.ftl"),
-                {"locale": "zz"},
-            )
-            assert paths.find_reference(join(root, "target", "yy_Latn", "c.po")) == (
+                join(paths.base, "{locale}", "a.ftl"),
+            ): paths.locales,
+            (
+                join(paths.ref_root, "b.ftl"),
+                join(paths.base, "{locale}", "b.ftl"),
+            ): paths.locales,
+            (
                 join(paths.ref_root, "c.pot"),
-                {"locale": "yy-Latn"},
-            )
-            assert paths.find_reference(join(root, "target", "ignore", "a.ftl")) is None
-            assert paths.find_reference(join(root, "target", "zz", "d.ftl")) is None
+                join(paths.base, "{locale}", "c.po"),
+            ): paths.locales,
+        }
+        assert paths.target(join(paths.ref_root, "c.pot")) == paths.target("c.pot")
+        assert paths.target("a.ftl") == (
+            join(paths.base, "{locale}", "a.ftl"),
+            paths.locales,
+        )
+        assert paths.target("c.pot") == (
+            join(paths.base, "{locale}", "c.po"),
+            paths.locales,
+        )
+        assert paths.target(join(root, "source", "en-US", "a.ftl")) == (None, ())
+        # This relies on the `yy_Latn` directory being actually present.
+        assert paths.format_target_path("{locale}/c.pot", "yy-Latn") == join(
+            paths.base, "yy_Latn", "c.pot"
+        )
+        assert paths.find_reference(join(root, "target", "zz", "a.ftl")) == (
+            join(paths.ref_root, "a.ftl"),
+            {"locale": "zz"},
+        )
+        assert paths.find_reference(join(root, "target", "yy_Latn", "c.po")) == (
+            join(paths.ref_root, "c.pot"),
+            {"locale": "yy-Latn"},
+        )
+        assert paths.find_reference(join(root, "target", "ignore", "a.ftl")) is None
+        assert paths.find_reference(join(root, "target", "zz", "d.ftl")) is None
 
     def test_ref_root(self):
         tree: Tree = {
@@ -186,30 +175,30 @@ class TestL10nDiscover(TestCase):
                 "yy_Latn": {"a.ftl": "", "b.ftl": ""},
             },
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
+        root = self.root
+        build_file_tree(root, tree)
 
-            paths = L10nDiscoverPaths(root, ref_root="source")
-            assert paths.ref_root == join(root, "source", "en")
-            assert paths.base == join(root, "target")
+        paths = L10nDiscoverPaths(root, ref_root="source")
+        assert paths.ref_root == join(root, "source", "en")
+        assert paths.base == join(root, "target")
 
-            paths = L10nDiscoverPaths(root, ref_root="source/en-US")
-            assert paths.ref_root == join(root, "source", "en-US")
-            assert paths.base == join(root, "target")
+        paths = L10nDiscoverPaths(root, ref_root="source/en-US")
+        assert paths.ref_root == join(root, "source", "en-US")
+        assert paths.base == join(root, "target")
 
-            paths = L10nDiscoverPaths(root, ref_root="target")
-            assert paths.ref_root == join(root, "target")
-            assert paths.base == join(root, "empty")
+        paths = L10nDiscoverPaths(root, ref_root="target")
+        assert paths.ref_root == join(root, "target")
+        assert paths.base == join(root, "empty")
 
-            paths = L10nDiscoverPaths(root, ref_root="target/ignore")
-            assert paths.ref_root == join(root, "target", "ignore")
-            assert paths.base == join(root, "target")
+        paths = L10nDiscoverPaths(root, ref_root="target/ignore")
+        assert paths.ref_root == join(root, "target", "ignore")
+        assert paths.base == join(root, "target")
 
-            with self.assertRaises(MissingSourceDirectoryError):
-                L10nDiscoverPaths(root, ref_root="empty")
+        with self.assertRaises(MissingSourceDirectoryError):
+            L10nDiscoverPaths(root, ref_root="empty")
 
-            with self.assertRaises(MissingSourceDirectoryError):
-                L10nDiscoverPaths(root, ref_root="missing")
+        with self.assertRaises(MissingSourceDirectoryError):
+            L10nDiscoverPaths(root, ref_root="missing")
 
     def test_ref_target_mixed(self):
         tree: Tree = {
@@ -219,15 +208,15 @@ class TestL10nDiscover(TestCase):
             "zz": {"a.ftl": "", "b.ftl": ""},
             "yy_Latn": {"a.ftl": "", "b.ftl": ""},
         }
-        with TemporaryDirectory() as root:
-            build_file_tree(root, tree)
-
-            paths = L10nDiscoverPaths(root)
-            assert paths.ref_root == join(root, "en")
-            assert paths.base == root
-            assert set(paths.locales) == set(["yy-Latn", "zz"])
-
-            paths = L10nDiscoverPaths(root, ref_root=join(root, "en-US"))
-            assert paths.ref_root == join(root, "en-US")
-            assert paths.base == root
-            assert set(paths.locales) == set(["yy-Latn", "zz"])
+        root = self.root
+        build_file_tree(root, tree)
+
+        paths = L10nDiscoverPaths(root)
+        assert paths.ref_root == join(root, "en")
+        assert paths.base == root
+        assert set(paths.locales) == set(["yy-Latn", "zz"])
+
+        paths = L10nDiscoverPaths(root, ref_root=join(root, "en-US"))
+        assert paths.ref_root == join(root, "en-US")
+        assert paths.base == root
+        assert set(paths.locales) == set(["yy-Latn", "zz"])
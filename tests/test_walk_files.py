@@ -16,11 +16,12 @@ from __future__ import annotations
 
 from os import getcwd, sep
 from os.path import join
-from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from moz.l10n.util import walk_files
 
+from . import fast_tempdir
+
 test_data_files = (
     "accounts.dtd",
     "angular.xliff",
@@ -38,30 +39,36 @@ test_data_files = (
 
 
 class TestWalkFiles(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmpdir = fast_tempdir()
+        cls.ignorepath = join(cls._tmpdir.name, ".l10n-ignore")
+        with open(cls.ignorepath, mode="w") as file:
+            file.write("__pycache__\n*.py\n")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+
     def test_direct_children(self):
         root = join(getcwd(), "tests", "resource", "data")
-        files = set(walk_files(root))
-        assert files == {join(root, path) for path in test_data_files}
+        files = sorted(walk_files(root))
+        assert files == sorted(join(root, path) for path in test_data_files)
 
     def test_dirs(self):
         root = getcwd()
-        files = set(walk_files(root, dirs=[f"tests{sep}resource{sep}data"]))
-        assert files == {
+        files = sorted(walk_files(root, dirs=[f"tests{sep}resource{sep}data"]))
+        assert files == sorted(
             join(root, "tests", "resource", "data", path) for path in test_data_files
-        }
+        )
 
     def test_l10nignore(self):
         root = getcwd()
-        with TemporaryDirectory() as tmpdir:
-            ignorepath = join(tmpdir, ".l10n-ignore")
-            with open(ignorepath, mode="w") as file:
-                file.write("__pycache__\n*.py\n")
-            files = set(
-                walk_files(
-                    root, dirs=["src", f"tests{sep}resource"], ignorepath=ignorepath
-                )
+        files = sorted(
+            walk_files(
+                root, dirs=["src", f"tests{sep}resource"], ignorepath=self.ignorepath
             )
-            assert files == {
-                join(root, "tests", "resource", "data", path)
-                for path in test_data_files
-            }
+        )
+        assert files == sorted(
+            join(root, "tests", "resource", "data", path) for path in test_data_files
+        )